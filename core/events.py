@@ -1,3 +1,12 @@
+"""
+Synchronous in-process event bus.
+
+Payloads: HEARTBEAT dict, SIGNAL_CREATED (Signal, candles, indicators),
+ORDER_PLACED OrderResult, TRADE_CLOSED trade, PRICE_TICK {"symbol", "price"}.
+Signal/OrderResult keep a __dict__ (no __slots__): execution and main_paper
+attach qty/stop/target/meta and _indicators_snapshot after construction.
+"""
+
 from enum import Enum, auto
 from typing import Any, Callable, Dict, List
 
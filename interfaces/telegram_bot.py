@@ -1,14 +1,32 @@
 # interfaces/telegram_bot.py
+import json
 import threading
 import time
 from typing import Optional, Any, Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
 import os
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from core.events import EventBus, EventType
 from core.models import Mode
 
+# One keep-alive pool for all Bot API calls (sends, long-poll, callback answers)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def _dumps_markup(markup: dict) -> str:
+    """Compact JSON for a reply_markup param; orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(markup).decode("utf-8")
+    return json.dumps(markup, ensure_ascii=False, separators=(",", ":"))
+
 
 class TelegramBot:
     """
@@ -104,7 +122,7 @@ class TelegramBot:
         ]
 
         try:
-            r = requests.get(
+            r = _SESSION.get(
                 f"{self.base}/setMyCommands",
                 params={"commands": commands},
                 timeout=10,
@@ -124,7 +142,7 @@ class TelegramBot:
 
     def _send_text(self, text: str) -> None:
         try:
-            r = requests.get(
+            r = _SESSION.get(
                 f"{self.base}/sendMessage",
                 params={"chat_id": self.chat_id, "text": text, "parse_mode": "HTML"},
                 timeout=10,
@@ -224,15 +242,14 @@ class TelegramBot:
     def _send_text_with_menu(self, text: str) -> None:
         """Send text message while preserving the inline keyboard menu."""
         try:
-            import json
             keyboard = self._get_menu_keyboard()
-            r = requests.get(
+            r = _SESSION.get(
                 f"{self.base}/sendMessage",
                 params={
                     "chat_id": self.chat_id,
                     "text": text,
                     "parse_mode": "HTML",
-                    "reply_markup": json.dumps(keyboard)
+                    "reply_markup": _dumps_markup(keyboard)
                 },
                 timeout=10,
             )
@@ -292,14 +309,13 @@ class TelegramBot:
         }
         
         try:
-            import json
-            r = requests.get(
+            r = _SESSION.get(
                 f"{self.base}/sendMessage",
                 params={
                     "chat_id": self.chat_id,
                     "text": "📊 <b>TradeMindIQ Control Center</b>\n\n<b>Tap a button:</b>",
                     "parse_mode": "HTML",
-                    "reply_markup": json.dumps(keyboard)
+                    "reply_markup": _dumps_markup(keyboard)
                 },
                 timeout=10,
             )
@@ -322,7 +338,7 @@ class TelegramBot:
             if caption:
                 data["caption"] = caption[:1024]
                 data["parse_mode"] = "HTML"
-            r = requests.post(f"{self.base}/sendPhoto", data=data, files=files, timeout=20)
+            r = _SESSION.post(f"{self.base}/sendPhoto", data=data, files=files, timeout=20)
             if self._tg_debug():
                 try:
                     print("[TELEGRAM_DEBUG] sendPhoto status=", r.status_code, "resp=", r.text)
@@ -1193,7 +1209,7 @@ class TelegramBot:
                 if self._update_offset is not None:
                     params["offset"] = self._update_offset
 
-                r = requests.get(
+                r = _SESSION.get(
                     f"{self.base}/getUpdates",
                     params=params,
                     timeout=35,
@@ -1220,7 +1236,7 @@ class TelegramBot:
 
                         # Answer callback query to remove loading state
                         try:
-                            requests.get(
+                            _SESSION.get(
                                 f"{self.base}/answerCallbackQuery",
                                 params={"callback_query_id": callback_id},
                                 timeout=5,
@@ -18,6 +18,7 @@ from services.scanner import ScannerService
 from services.risk import RiskManager
 from services.portfolio import PortfolioTracker
 from services.heartbeat import Heartbeat
+from services.telegram_dashboard import subscribe_shared_dashboard
 
 from interfaces.telegram_bot import TelegramBot
 from storage.db import TradeRepository
@@ -422,6 +423,9 @@ async def main() -> None:
     # Subscribe post-trade review handler to trade closed events
     bus.subscribe(EventType.TRADE_CLOSED, on_trade_closed)
 
+    # Drop cached Telegram dashboard responses when a trade closes
+    subscribe_shared_dashboard(bus)
+
     # ---------- Scanner ----------
     # Universe/session filtering (optional): prefer universes.crypto/equities_us when present.
     universes = cfg.get("universes", {}) or {}
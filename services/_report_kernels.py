@@ -0,0 +1,40 @@
+"""
+Report aggregation kernels.
+Fused per-day / per-hour / per-exit-reason reduction over flat trade
+columns; Numba-compiled when available, np.bincount otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+
+def _aggregate_np(ts, pnl, exit_code, day0, out_trades, out_wins, out_pnl, out_hour, out_exit):
+    """Accumulate into the out_* arrays with one bincount per output."""
+    day_idx = ts // 86400 - day0
+    n_days = out_trades.size
+    out_trades += np.bincount(day_idx, minlength=n_days)
+    out_wins += np.bincount(day_idx[pnl > 0], minlength=n_days)
+    out_pnl += np.bincount(day_idx, weights=pnl, minlength=n_days)
+    out_hour += np.bincount((ts // 3600) % 24, minlength=out_hour.size)
+    out_exit += np.bincount(exit_code, minlength=out_exit.size)
+
+
+def _aggregate_loop(ts, pnl, exit_code, day0, out_trades, out_wins, out_pnl, out_hour, out_exit):
+    """Single fused pass; only worth it compiled."""
+    for i in range(ts.size):
+        d = ts[i] // 86400 - day0
+        out_trades[d] += 1
+        out_wins[d] += pnl[i] > 0
+        out_pnl[d] += pnl[i]
+        out_hour[(ts[i] // 3600) % 24] += 1
+        out_exit[exit_code[i]] += 1
+
+
+if njit is not None:
+    aggregate = njit(cache=True)(_aggregate_loop)
+else:
+    aggregate = _aggregate_np
@@ -5,6 +5,7 @@ Safe, non-intrusive analytics that reads from trades.db
 Does NOT modify any existing data or core logic.
 """
 
+import os
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
@@ -12,6 +13,24 @@ from dataclasses import dataclass
 from collections import defaultdict
 import json
 
+import numpy as np
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+from services._report_kernels import aggregate
+
+
+def _dumps_value(value) -> bytes:
+    """indent=2 JSON bytes for a top-level value, nested one level deep."""
+    if orjson is not None:
+        out = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        out = json.dumps(value, indent=2).encode("utf-8")
+    return out.replace(b"\n", b"\n  ")
+
 
 @dataclass
 class TradeMetrics:
@@ -75,33 +94,62 @@ class PerformanceAnalytics:
             db_path: Path to trades.db (relative or absolute)
         """
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
         self._db_exists = False
         self._check_db_exists()
     
     def _check_db_exists(self) -> bool:
         """Check if database file exists and is valid."""
         try:
-            import os
-            if os.path.exists(self.db_path):
-                conn = sqlite3.connect(self.db_path)
+            conn = self.conn
+            if conn is not None:
                 cursor = conn.cursor()
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='trades'")
                 if cursor.fetchone():
                     self._db_exists = True
-                conn.close()
         except Exception:
             self._db_exists = False
         return self._db_exists
     
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """
+        Long-lived connection to trades.db, opened with WAL and read-friendly
+        PRAGMAs on first use. None while the database file doesn't exist.
+        """
+        if self._conn is None and os.path.exists(self.db_path):
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            try:
+                conn.executescript(
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA cache_size=-65536;"
+                    "PRAGMA mmap_size=268435456;"
+                )
+            except sqlite3.Error:
+                pass  # e.g. read-only file; defaults still work
+            self._conn = conn
+        return self._conn
+    
+    def close(self) -> None:
+        """Close the shared database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def _connect(self) -> sqlite3.Connection:
-        """Create database connection."""
-        import os
-        if not os.path.exists(self.db_path):
+        """Shared database connection, or a demo in-memory one if trades.db is missing."""
+        conn = self.conn
+        if conn is None:
             # Create a temporary in-memory database for demo purposes
             conn = sqlite3.connect(":memory:")
             self._create_demo_schema(conn)
-            return conn
-        return sqlite3.connect(self.db_path)
+        return conn
+    
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Close a connection from _connect unless it is the shared one."""
+        if conn is not self._conn:
+            conn.close()
     
     def _create_demo_schema(self, conn) -> None:
         """Create demo schema and sample data for when DB doesn't exist."""
@@ -123,6 +171,9 @@ class PerformanceAnalytics:
     
     def _row_to_trade(self, row: tuple, columns: List[str]) -> TradeMetrics:
         """Convert database row to TradeMetrics object."""
+        # Parse each timestamp once; duration comes from the parsed values
+        created_at = datetime.fromisoformat(row[columns.index('created_at')])
+        closed_at = datetime.fromisoformat(row[columns.index('closed_at')])
         return TradeMetrics(
             id=row[columns.index('id')],
             symbol=row[columns.index('symbol')],
@@ -135,13 +186,10 @@ class PerformanceAnalytics:
                 row[columns.index('exit_price')],
                 row[columns.index('side')]
             ),
-            duration_seconds=self._calculate_duration(
-                row[columns.index('created_at')],
-                row[columns.index('closed_at')]
-            ),
+            duration_seconds=(closed_at - created_at).total_seconds(),
             exit_reason=row[columns.index('exit_reason')],
-            created_at=datetime.fromisoformat(row[columns.index('created_at')]),
-            closed_at=datetime.fromisoformat(row[columns.index('closed_at')])
+            created_at=created_at,
+            closed_at=closed_at
         )
     
     def _calculate_pnl_pct(self, entry: float, exit: float, side: str) -> float:
@@ -165,10 +213,10 @@ class PerformanceAnalytics:
             cursor.execute("SELECT * FROM trades WHERE closed_at IS NOT NULL ORDER BY closed_at DESC")
             rows = cursor.fetchall()
             if not rows:
-                conn.close()
+                self._release(conn)
                 return []
             columns = [desc[0] for desc in cursor.description]
-            conn.close()
+            self._release(conn)
             return [self._row_to_trade(row, columns) for row in rows]
         except Exception:
             return []
@@ -184,14 +232,84 @@ class PerformanceAnalytics:
             )
             rows = cursor.fetchall()
             if not rows:
-                conn.close()
+                self._release(conn)
                 return []
             columns = [desc[0] for desc in cursor.description]
-            conn.close()
+            self._release(conn)
             return [self._row_to_trade(row, columns) for row in rows]
         except Exception:
             return []
     
+    def get_trades_arrays(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Closed trades in a date range as flat columns, skipping TradeMetrics.
+        
+        Returns:
+            (closed_at unix seconds int64[N], pnl float64[N],
+             exit reason codes intp[N], exit reason labels indexed by code).
+            Codes are assigned most recent reason first.
+        """
+        rows = []
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT CAST(strftime('%s', closed_at) AS INTEGER), pnl, exit_reason FROM trades "
+                "WHERE closed_at BETWEEN ? AND ? ORDER BY closed_at DESC",
+                (start_date.isoformat(), end_date.isoformat())
+            )
+            rows = cursor.fetchall()
+            self._release(conn)
+        except Exception:
+            rows = []
+        
+        n = len(rows)
+        codes: Dict[str, int] = {}
+        timestamps = np.fromiter((r[0] for r in rows), dtype=np.int64, count=n)
+        pnl = np.fromiter((r[1] or 0.0 for r in rows), dtype=np.float64, count=n)
+        exit_codes = np.fromiter((codes.setdefault(r[2], len(codes)) for r in rows), dtype=np.intp, count=n)
+        return timestamps, pnl, exit_codes, list(codes)
+    
+    def aggregate_by_date(self, start_date: datetime, end_date: datetime) -> Dict[str, object]:
+        """
+        Per-day, per-hour and per-exit-reason aggregates for a date range,
+        reduced in one fused pass over get_trades_arrays columns.
+        
+        Returns:
+            {"daily": {"dates": [...], "trades": [...], "wins": [...], "pnl": [...]}
+                       as parallel columns ordered by day,
+             "hourly": {hour: trades},
+             "exit_reasons": {reason: trades}}
+        """
+        timestamps, pnl, exit_codes, reasons = self.get_trades_arrays(start_date, end_date)
+        if not timestamps.size:
+            return {"daily": {"dates": [], "trades": [], "wins": [], "pnl": []}, "hourly": {}, "exit_reasons": {}}
+        
+        day0 = int(timestamps.min()) // 86400
+        n_days = int(timestamps.max()) // 86400 - day0 + 1
+        daily_trades = np.zeros(n_days, dtype=np.int64)
+        daily_wins = np.zeros(n_days, dtype=np.int64)
+        daily_pnl = np.zeros(n_days, dtype=np.float64)
+        hourly = np.zeros(24, dtype=np.int64)
+        exits = np.zeros(len(reasons), dtype=np.int64)
+        aggregate(timestamps, pnl, exit_codes, day0, daily_trades, daily_wins, daily_pnl, hourly, exits)
+        
+        days = np.flatnonzero(daily_trades)
+        return {
+            "daily": {
+                "dates": np.datetime_as_string((day0 + days).astype("datetime64[D]")).tolist(),
+                "trades": daily_trades[days].tolist(),
+                "wins": daily_wins[days].tolist(),
+                "pnl": daily_pnl[days].tolist(),
+            },
+            "hourly": {int(h): int(hourly[h]) for h in np.flatnonzero(hourly)},
+            "exit_reasons": {reason: int(exits[code]) for code, reason in enumerate(reasons)},
+        }
+    
     def get_trades_by_symbol(self, symbol: str) -> List[TradeMetrics]:
         """Get all trades for a specific symbol."""
         try:
@@ -203,10 +321,10 @@ class PerformanceAnalytics:
             )
             rows = cursor.fetchall()
             if not rows:
-                conn.close()
+                self._release(conn)
                 return []
             columns = [desc[0] for desc in cursor.description]
-            conn.close()
+            self._release(conn)
             return [self._row_to_trade(row, columns) for row in rows]
         except Exception:
             return []
@@ -272,8 +390,7 @@ class PerformanceAnalytics:
         # Daily P&L
         daily = defaultdict(float)
         for t in trades:
-            day = t.closed_at.strftime('%Y-%m-%d')
-            daily[day] += t.pnl
+            daily[t.closed_at.date().isoformat()] += t.pnl
         
         return PerformanceSummary(
             total_trades=len(trades),
@@ -402,14 +519,14 @@ class PerformanceAnalytics:
         
         return "\n".join(lines)
     
-    def export_to_json(self, days: Optional[int] = None) -> str:
-        """Export performance data as JSON."""
+    def _export_data(self, days: Optional[int] = None) -> Dict:
+        """Performance data in export layout."""
         if days:
             summary = self.get_recent_performance(days)
         else:
             summary = self.calculate_performance_summary()
         
-        data = {
+        return {
             "generated_at": datetime.now().isoformat(),
             "period": f"last_{days}_days" if days else "all_time",
             "summary": {
@@ -441,8 +558,21 @@ class PerformanceAnalytics:
             "exit_reasons": summary.exit_reason_counts,
             "daily_pnl": summary.daily_pnl
         }
-        
-        return json.dumps(data, indent=2)
+    
+    def export_to_json(self, days: Optional[int] = None) -> str:
+        """Export performance data as JSON."""
+        return json.dumps(self._export_data(days), indent=2)
+    
+    def stream_to_json(self, f, days: Optional[int] = None) -> None:
+        """
+        Write export_to_json's document to binary file f one top-level key
+        at a time, without building the whole string first.
+        """
+        f.write(b"{")
+        for n, (key, value) in enumerate(self._export_data(days).items()):
+            f.write((b",\n  " if n else b"\n  ") + json.dumps(key).encode("utf-8") + b": ")
+            f.write(_dumps_value(value))
+        f.write(b"\n}")
 
 
 # Convenience functions for CLI usage
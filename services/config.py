@@ -0,0 +1,18 @@
+"""
+Settings loader.
+Parses a settings YAML once per path and hands back the cached dict;
+uses the libyaml-backed CSafeLoader when PyYAML was built with it.
+"""
+
+import functools
+
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def load_settings(path: str = "settings.yaml") -> dict:
+    """Return the parsed settings at `path` (shared; treat as read-only)."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_Loader) or {}
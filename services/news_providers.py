@@ -13,6 +13,11 @@ try:
 except Exception:
     feedparser = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 
 def _env_or_literal(v: str) -> str:
     if isinstance(v, str) and v.startswith("ENV:"):
@@ -55,7 +60,7 @@ class CryptoPanicProvider:
         if r.status_code != 200:
             return []
 
-        data = r.json() or {}
+        data = (orjson.loads(r.content) if orjson is not None else r.json()) or {}
         results = data.get("results") or []
 
         out: List[NewsItem] = []
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import time
+import heapq
 import hashlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from services.news_providers import CryptoPanicProvider, RSSProvider, NewsItem, _env_or_literal
 from services.news_scoring import score_item, infer_symbols
@@ -21,6 +22,19 @@ class NewsService:
         # In-memory cache: url_hash -> enriched record
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._cache_ts: Dict[str, int] = {}
+        # Inverted index: base symbol -> cache keys whose record mentions it
+        self._symbol_index: Dict[str, Set[str]] = {}
+        # Keys present in the latest fetch_all result
+        self._live_keys: Set[str] = set()
+
+        # Disabled (e.g. backtests): skip provider/universe setup entirely;
+        # fetch_all and get_snapshot_for_symbol early-return on self.enabled.
+        if not self.enabled:
+            self.cp = None
+            self.rss = None
+            self.known_symbols: List[str] = []
+            self.aliases: Dict[str, str] = {}
+            return
 
         providers = self.news_cfg.get("providers") or {}
 
@@ -38,6 +52,20 @@ class NewsService:
             feeds = providers["rss"].get("feeds") or []
             self.rss = RSSProvider(feeds=feeds)
 
+        # Per-provider refresh cadence: CryptoPanic is near-real-time, RSS
+        # feeds typically only update every few minutes.
+        self._provider_ttl = {
+            "cp": int((providers.get("cryptopanic") or {}).get("ttl_s", 15)),
+            "rss": int((providers.get("rss") or {}).get("ttl_s", 120)),
+        }
+        self._provider_ts: Dict[str, int] = {"cp": 0, "rss": 0}
+        self._provider_cache: Dict[str, List[NewsItem]] = {"cp": [], "rss": []}
+        # bumped on every provider refresh; the deduped fetch_all result is
+        # reused while it is unchanged
+        self._provider_gen = 0
+        self._fetch_gen = -1
+        self._fetch_out: List[NewsItem] = []
+
         # Known symbols (for relevance)
         # Derive from your config symbols, stripping pairs
         all_syms = set()
@@ -67,13 +95,19 @@ class NewsService:
         if not self.enabled:
             return []
 
+        now = int(time.time())
         items: List[NewsItem] = []
         if self.cp:
-            items.extend(self.cp.fetch(limit=80))
+            items.extend(self._provider_items("cp", lambda: self.cp.fetch(limit=80), now))
         if self.rss:
-            items.extend(self.rss.fetch(limit_per_feed=25))
+            items.extend(self._provider_items("rss", lambda: self.rss.fetch(limit_per_feed=25), now))
+
+        # no provider refreshed -> same items as last call; skip hashing/dedupe
+        if self._provider_gen == self._fetch_gen:
+            return list(self._fetch_out)
 
-        # basic dedupe by url/title hash
+        # basic dedupe by url/title hash; score each new item once per fetch
+        # cycle (the feed is global, so every symbol shares these records)
         seen = set()
         out = []
         for it in items:
@@ -82,7 +116,58 @@ class NewsService:
                 continue
             seen.add(k)
             out.append(it)
-        return out
+            if k not in self._cache or not self._within_window(self._cache_ts.get(k, now)):
+                self._store(k, self._enrich(it), now)
+        self._live_keys = seen
+
+        # evict stale records that have dropped out of every feed
+        for k in [k for k, ts in self._cache_ts.items() if k not in seen and not self._within_window(ts)]:
+            self._evict(k)
+
+        self._fetch_gen = self._provider_gen
+        self._fetch_out = out
+        return list(out)
+
+    def _store(self, k: str, rec: Dict[str, Any], now: int) -> None:
+        if k in self._cache:
+            self._evict(k)
+        self._cache[k] = rec
+        self._cache_ts[k] = now
+        for sym in rec["symbols"]:
+            self._symbol_index.setdefault(sym, set()).add(k)
+
+    def _evict(self, k: str) -> None:
+        rec = self._cache.pop(k)
+        self._cache_ts.pop(k, None)
+        for sym in rec["symbols"]:
+            keys = self._symbol_index.get(sym)
+            if keys is not None:
+                keys.discard(k)
+                if not keys:
+                    del self._symbol_index[sym]
+
+    def _provider_items(self, name: str, fetch, now: int) -> List[NewsItem]:
+        """Return the provider's last result unless its TTL has elapsed."""
+        if now - self._provider_ts[name] >= self._provider_ttl[name]:
+            self._provider_cache[name] = fetch()
+            self._provider_ts[name] = now
+            self._provider_gen += 1
+        return self._provider_cache[name]
+
+    def _enrich(self, item: NewsItem) -> Dict[str, Any]:
+        s = score_item(item)
+        syms = infer_symbols(item.title, self.known_symbols, self.aliases)
+        return {
+            "ts": item.ts,
+            "source": item.source,
+            "title": item.title,
+            "url": item.url,
+            "symbols": syms,
+            "impact": s["impact"],
+            "category": s["category"],
+            "bias": s["bias"],
+            "why": s["why"],
+        }
 
     def get_snapshot_for_symbol(self, symbol: str) -> Dict[str, Any]:
         """
@@ -94,43 +179,24 @@ class NewsService:
         base = symbol.split("/")[0].upper()
         now = int(time.time())
 
-        items = self.fetch_all()
+        self.fetch_all()
 
+        # relevance: only records indexed under this symbol and still in the feed
         enriched = []
-        for it in items:
-            k = self._key(it)
-
-            # cached?
-            if k in self._cache and self._within_window(self._cache_ts.get(k, now)):
-                rec = self._cache[k]
-            else:
-                s = score_item(it)
-                syms = infer_symbols(it.title, self.known_symbols, self.aliases)
-                rec = {
-                    "ts": it.ts,
-                    "source": it.source,
-                    "title": it.title,
-                    "url": it.url,
-                    "symbols": syms,
-                    "impact": s["impact"],
-                    "category": s["category"],
-                    "bias": s["bias"],
-                    "why": s["why"],
-                }
-                self._cache[k] = rec
-                self._cache_ts[k] = now
-
-            # relevance
-            if base in (rec.get("symbols") or []) and rec.get("impact", 0.0) >= self.min_impact:
+        for k in self._symbol_index.get(base, ()):
+            if k not in self._live_keys:
+                continue
+            rec = self._cache[k]
+            if rec.get("impact", 0.0) >= self.min_impact:
                 enriched.append(rec)
 
-        # sort by impact then recency
-        enriched.sort(key=lambda r: (r.get("impact", 0.0), r.get("ts", 0)), reverse=True)
-        top = enriched[: self.max_items]
+        # top-K by impact then recency (descending)
+        top = heapq.nlargest(self.max_items, enriched, key=lambda r: (r.get("impact", 0.0), r.get("ts", 0)))
 
+        impacts = [r["impact"] for r in top]
         agg = {
-            "impact_max": max([r["impact"] for r in top], default=0.0),
-            "impact_sum": sum([r["impact"] for r in top], start=0.0),
+            "impact_max": max(impacts, default=0.0),
+            "impact_sum": sum(impacts, start=0.0),
             "dominant_bias": (top[0]["bias"] if top else "unknown"),
             "count": len(top),
         }
@@ -1,14 +1,73 @@
+import asyncio
 import math
+from operator import itemgetter
+
+import numpy as np
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+# Tape side codes (int8): buy=1, sell=-1, anything else=0
+_SIDE_CODES = {"buy": 1, "sell": -1}
+
+# ccxt unified trade dicts always carry these keys (values may be None)
+_get_side_price_amount = itemgetter("side", "price", "amount")
+
+
+def _tape_notionals_np(prices, amounts, sides):
+    notionals = prices * amounts
+    return float(notionals[sides == 1].sum()), float(notionals[sides == -1].sum())
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _tape_notionals(prices, amounts, sides):
+        # single fused pass; beats NumPy's per-call overhead at tape sizes (~60)
+        buy = 0.0
+        sell = 0.0
+        for i in range(prices.size):
+            n = prices[i] * amounts[i]
+            buy += n * (sides[i] == 1)
+            sell += n * (sides[i] == -1)
+        return buy, sell
+else:
+    _tape_notionals = _tape_notionals_np
+
+
+def _book_notional(levels):
+    if not levels:
+        return 0.0
+    arr = np.asarray(levels, dtype=float)
+    return float(np.dot(arr[:, 0], arr[:, 1]))
+
+
+def _tape_arrays(trades):
+    n = len(trades)
+    prices = np.empty(n, dtype=float)
+    amounts = np.empty(n, dtype=float)
+    sides = np.empty(n, dtype=np.int8)
+    get3 = _get_side_price_amount
+    codes = _SIDE_CODES
+    for i, t in enumerate(trades):
+        side, price, amount = get3(t)
+        prices[i] = float(price or 0.0)
+        amounts[i] = float(amount or 0.0)
+        sides[i] = codes.get((side or "").lower(), 0)
+    return prices, amounts, sides
+
 
 class OrderFlowService:
     def __init__(self, exchange, book_depth=8, tape_trades=60):
         self.exchange = exchange
         self.book_depth = int(book_depth)
         self.tape_trades = int(tape_trades)
+        self._ob_limit = max(20, self.book_depth * 2)
 
     async def snapshot(self, symbol: str):
         # Order book
-        ob = await self.exchange.fetch_order_book(symbol, limit=max(20, self.book_depth * 2))
+        ob = await self.exchange.fetch_order_book(symbol, limit=self._ob_limit)
         bids = ob.get("bids") or []
         asks = ob.get("asks") or []
 
@@ -16,23 +75,13 @@ class OrderFlowService:
         bd = bids[: self.book_depth]
         ad = asks[: self.book_depth]
 
-        bid_notional = sum(float(p) * float(a) for p, a in bd) if bd else 0.0
-        ask_notional = sum(float(p) * float(a) for p, a in ad) if ad else 0.0
+        bid_notional = _book_notional(bd)
+        ask_notional = _book_notional(ad)
         bid_ask_ratio = (bid_notional / ask_notional) if ask_notional > 0 else math.inf
 
-        # Tape (recent trades)
+        # Tape (recent trades): numba kernel when available, else masked NumPy sums
         trades = await self.exchange.fetch_trades(symbol, limit=self.tape_trades)
-        buy_notional = 0.0
-        sell_notional = 0.0
-        for t in trades or []:
-            side = (t.get("side") or "").lower()
-            price = float(t.get("price") or 0.0)
-            amount = float(t.get("amount") or 0.0)
-            notional = price * amount
-            if side == "buy":
-                buy_notional += notional
-            elif side == "sell":
-                sell_notional += notional
+        buy_notional, sell_notional = _tape_notionals(*_tape_arrays(trades or []))
 
         buy_sell_ratio = (buy_notional / sell_notional) if sell_notional > 0 else math.inf
 
@@ -44,3 +93,12 @@ class OrderFlowService:
             "sell_notional": sell_notional,
             "buy_sell_ratio": buy_sell_ratio,
         }
+
+    async def snapshot_many(self, symbols):
+        """
+        Snapshot several symbols with their exchange calls in flight together.
+        Returns {symbol: snapshot}; a failed symbol maps to its exception.
+        """
+        symbols = list(symbols)
+        results = await asyncio.gather(*(self.snapshot(s) for s in symbols), return_exceptions=True)
+        return dict(zip(symbols, results))
@@ -11,15 +11,169 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import json
+import time
 import sqlite3
+import functools
+from operator import attrgetter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+import numpy as np
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from services.analytics import PerformanceAnalytics
 
 
-@dataclass
+SETTINGS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "settings.yaml")
+
+# Reused verbatim so sqlite3's statement cache keeps it prepared
+OPEN_TRADES_SQL = """
+    SELECT symbol, side, entry, exit_price, pnl, created_at, closed_at
+    FROM trades
+    WHERE closed_at IS NULL
+    LIMIT 50
+"""
+
+def _unrealized_pnl_arrays(
+    entries: np.ndarray,
+    currents: np.ndarray,
+    quantities: np.ndarray,
+    signs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized unrealized P&L and percentage; signs are +1 long / -1 short."""
+    diff = (currents - entries) * signs
+    pct = np.divide(diff * 100.0, entries, out=np.zeros_like(diff), where=entries != 0)
+    return diff * quantities, pct
+
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, descending; O(n) partition then sort k."""
+    if len(values) <= k:
+        return np.argsort(-values, kind="stable")
+    idx = np.argpartition(-values, k - 1)[:k]
+    return idx[np.argsort(-values[idx], kind="stable")]
+
+
+# Dashboard line templates (parsed once, filled per row)
+_POS_LINE_TMPL = (
+    "{emoji} {symbol:<12} {side:<4} "
+    "Entry: ${entry:.4f}  "
+    "Cur: ${cur:.4f}  "
+    "P/L: ${pnl:>8.2f} ({pct:>5.2f}%)"
+)
+_TOP_LINE_TMPL = "  {symbol:<12} +${pnl:.2f}"
+_WORST_LINE_TMPL = "  {symbol:<12} ${pnl:.2f}"
+_COMPACT_LINE_TMPL = "{emoji} {symbol:<10} {side:<4} ${pnl:>7.2f}"
+
+_DASHBOARD_HEADER = ("=" * 50, "🤖 TRADEMINDIQ PORTFOLIO DASHBOARD", "=" * 50)
+_OPEN_POSITIONS_HEADER = ("📍 OPEN POSITIONS", "-" * 40)
+_TOP_PERFORMERS_HEADER = ("", "🏆 TOP PERFORMERS", "-" * 40)
+_UNDERPERFORMERS_HEADER = ("", "⚠️ UNDERPERFORMERS", "-" * 40)
+_DASHBOARD_FOOTER = ("", "=" * 50)
+
+
+def _fill_for_output(fill: dict) -> dict:
+    """Copy of a fill record with its epoch-ns stamp rendered as ISO 'timestamp'."""
+    out = dict(fill)
+    ns = out.pop("timestamp_ns", None)
+    if ns is not None:
+        out["timestamp"] = datetime.fromtimestamp(ns / 1e9).isoformat()
+    return out
+
+
+# Fields read from an order in register_order (single C-level lookup)
+_ORDER_FIELDS = attrgetter("symbol", "side", "qty", "entry_price")
+
+def _dumps_indented(value: Any, depth: int) -> bytes:
+    """indent=2 JSON for a value nested `depth` levels deep."""
+    if orjson is not None:
+        out = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        out = json.dumps(value, indent=2).encode("utf-8")
+    return out.replace(b"\n", b"\n" + b"  " * depth)
+
+
+def _dump_json_stream(data: dict, f) -> None:
+    """
+    Write a top-level dict to binary file f piece by piece, laid out exactly
+    like json.dump(indent=2), without materializing the whole document.
+    """
+    f.write(b"{")
+    for n, (key, value) in enumerate(data.items()):
+        f.write((b",\n  " if n else b"\n  ") + json.dumps(key).encode("utf-8") + b": ")
+        if isinstance(value, list) and value:
+            f.write(b"[")
+            for i, item in enumerate(value):
+                f.write((b",\n    " if i else b"\n    ") + _dumps_indented(item, 2))
+            f.write(b"\n  ]")
+        else:
+            f.write(_dumps_indented(value, 1))
+    f.write(b"\n}" if data else b"}")
+
+
+# Prices fetched within the same window are reused across scans/polls
+PRICE_CACHE_TTL_SECONDS = 5
+
+
+# Scale-out evaluator status codes
+SCALE_OUT_NONE = 0
+SCALE_OUT_TP1 = 1
+SCALE_OUT_TP2 = 2
+
+
+def _eval_scale_out_py(
+    current: float,
+    sign: float,
+    tp1_price: float,
+    tp2_price: float,
+    tp1_done: bool,
+    tp2_enabled: bool
+) -> int:
+    """Pure-numeric TP1/TP2 decision for one tick; returns a SCALE_OUT_* code."""
+    # (current - tp) * sign >= 0 is "reached" for longs (+1) and shorts (-1) alike
+    if not tp1_done:
+        return 1 if (current - tp1_price) * sign >= 0.0 else 0
+    if tp2_enabled and (current - tp2_price) * sign >= 0.0:
+        return 2
+    return 0
+
+
+if njit is not None:
+    _eval_scale_out = njit(cache=True)(_eval_scale_out_py)
+    _eval_scale_out(1.0, 1.0, 1.01, 1.03, False, True)  # compile at import, not first tick
+else:
+    _eval_scale_out = _eval_scale_out_py
+
+
+# (settings.yaml signature, parsed scale-out section), shared by every
+# tracker in the process while the file is unchanged
+_SCALE_OUT_CACHE: Optional[Tuple[Tuple, dict]] = None
+
+# Used when settings.yaml cannot be read
+DEFAULT_SCALE_OUT_CONFIG = {
+    "enabled": True,
+    "tp1_r": 1.0,
+    "tp1_frac": 0.5,
+    "tp2_enabled": True,
+    "tp2_r": 3.0,
+    "breakeven_buffer": 0.001
+}
+
+# __slots__ dataclasses need Python 3.10+; plain dataclasses on older versions
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Position:
     """Current open position."""
     symbol: str
@@ -32,9 +186,11 @@ class Position:
     unrealized_pnl_pct: float
     entry_time: datetime
     duration_seconds: float
+    stop_price: Optional[float] = None
+    meta: Dict[str, Any] = field(default_factory=dict)  # scale-out state
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PortfolioSummary:
     """Portfolio overview."""
     total_equity: float
@@ -42,7 +198,7 @@ class PortfolioSummary:
     total_realized_pnl: float
     open_positions: List[Position]
     positions_by_exchange: Dict[str, List[Position]]
-    positions_by_symbol: Dict[str, Position]
+    positions_by_symbol: Mapping[str, Position]  # read-only live view
     top_performers: List[Position]
     worst_performers: List[Position]
     exposure_by_symbol: Dict[str, float]
@@ -60,13 +216,27 @@ class PortfolioTracker:
     def __init__(self, db_path: str = "trades.db", telegram=None):
         self.db_path = db_path
         self.analytics = PerformanceAnalytics(db_path)
-        self._positions: Dict[str, List[Position]] = defaultdict(list)
+        self._conn: Optional[sqlite3.Connection] = None  # opened lazily, reused
+        self._positions: List[Position] = []  # all exchanges; Position.exchange tags each
+        self._positions_by_symbol: Dict[str, Position] = {}  # lookup index for tick path
+        # Struct-of-arrays view of the last scan, row i == scanned position i
+        self._pos_arrays: Dict[str, np.ndarray] = {}
         self._current_prices: Dict[str, float] = {}
         self._open_orders: List = []  # Track open orders
+        # Per-instance price cache keyed by (symbol, TTL bucket)
+        self._price_cached = functools.lru_cache(maxsize=512)(self._fetch_price)
         self.telegram = telegram  # Optional Telegram bot for notifications
         
+        # Scale-out config is parsed once here, not per tick; see reload_config()
+        self._scale_cfg: dict = {}
+        self._scale_cfg_mtime: Optional[float] = None
+        self.reload_config()
+        
         # Initialize with some simulated current prices
         self._initialize_simulated_prices()
+        
+        # Seed positions (and the symbol index) once
+        self.scan_for_open_positions()
     
     @property
     def open_orders(self) -> List:
@@ -78,12 +248,20 @@ class PortfolioTracker:
         if hasattr(order, 'symbol'):
             # Create a Position-like object for tracking
             try:
-                entry = float(getattr(order, 'entry_price', getattr(order, 'filled_price', 0)) or 0)
-                qty = float(getattr(order, 'qty', 0) or 0)
-                side = getattr(order, 'side', 'BUY') or 'BUY'
+                try:
+                    symbol, side, qty, entry = _ORDER_FIELDS(order)
+                except AttributeError:
+                    # Partial order objects: per-field defaults
+                    symbol = order.symbol
+                    side = getattr(order, 'side', 'BUY')
+                    qty = getattr(order, 'qty', 0)
+                    entry = getattr(order, 'entry_price', None)
+                entry = float(entry or getattr(order, 'filled_price', 0) or 0)
+                qty = float(qty or 0)
+                side = side or 'BUY'
                 
                 position = Position(
-                    symbol=getattr(order, 'symbol', 'UNKNOWN'),
+                    symbol=symbol,
                     exchange="kucoin",
                     side=side,
                     entry_price=entry,
@@ -94,7 +272,8 @@ class PortfolioTracker:
                     entry_time=datetime.now(),
                     duration_seconds=0
                 )
-                self._positions["kucoin"].append(position)
+                self._positions.append(position)
+                self._positions_by_symbol[position.symbol] = position
                 self._open_orders.append(order)
             except Exception as e:
                 print(f"[PortfolioTracker] Error registering order: {e}")
@@ -123,6 +302,30 @@ class PortfolioTracker:
             "OP/USDT": 1.5,
             "SUI/USDT": 2.5,
         }
+        
+        # Demo positions for showcase, seeded once; scans update them in place
+        now = datetime.now()
+        demo_positions = [
+            {"symbol": "BTC/USDT", "side": "BUY", "entry": 98500.0, "qty": 0.01},
+            {"symbol": "SOL/USDT", "side": "BUY", "entry": 195.0, "qty": 2.0},
+            {"symbol": "ETH/USDT", "side": "BUY", "entry": 3400.0, "qty": 0.2},
+        ]
+        positions = self._positions
+        for pos in demo_positions:
+            position = Position(
+                symbol=pos["symbol"],
+                exchange="kucoin",
+                side=pos["side"],
+                entry_price=pos["entry"],
+                current_price=pos["entry"],
+                quantity=pos["qty"],
+                unrealized_pnl=0,
+                unrealized_pnl_pct=0,
+                entry_time=now - timedelta(minutes=30),
+                duration_seconds=1800
+            )
+            positions.append(position)
+            self._positions_by_symbol[position.symbol] = position
     
     # ==================== SCALE-OUT STRATEGY ====================
     
@@ -133,17 +336,12 @@ class PortfolioTracker:
         Returns:
             Dict with scale_out event info if TP1 hit, None otherwise
         """
-        # Get open positions for this symbol
-        summary = self.get_portfolio_summary()
-        position = summary.positions_by_symbol.get(symbol)
+        # Get open position for this symbol
+        position = self._positions_by_symbol.get(symbol)
         
         if not position:
             return None
         
-        # Initialize scale-out state if not exists
-        if not hasattr(position, "meta") or position.meta is None:
-            position.meta = {}
-        
         meta = position.meta
         
         # Initialize state tracking
@@ -156,7 +354,7 @@ class PortfolioTracker:
         if "entry_price" not in meta:
             meta["entry_price"] = position.entry_price
         if "stop_init" not in meta:
-            meta["stop_init"] = getattr(position, "stop_price", None) or position.entry_price * 0.99
+            meta["stop_init"] = position.stop_price or position.entry_price * 0.99
         if "risk_per_unit" not in meta:
             meta["risk_per_unit"] = abs(meta["entry_price"] - meta["stop_init"])
         
@@ -164,31 +362,27 @@ class PortfolioTracker:
         if meta.get("remaining_qty", 0) <= 0:
             return None
         
-        # Get scale-out config
-        scale_cfg = self._get_scale_out_config()
-        if not scale_cfg.get("enabled", False):
+        # Scale-out config (cached)
+        if not self._scale_enabled:
             return None
         
-        # Calculate direction and prices
-        side = position.side.upper()
-        sign = 1 if side == "BUY" else -1
+        # Direction and TP1/TP2 trigger prices are fixed per position
+        if "tp1_price" not in meta:
+            self._set_scale_out_targets(meta, 1 if position.side.upper() == "BUY" else -1)
+        sign = meta["sign"]
         entry = meta["entry_price"]
-        risk_per_unit = meta.get("risk_per_unit", abs(entry - meta["stop_init"]))
-        
-        # TP1 calculation
-        tp1_r = scale_cfg.get("tp1_r", 1.0)
-        tp1_price = entry + sign * (tp1_r * risk_per_unit)
         
-        # Check TP1 hit
-        tp1_hit = False
-        if sign > 0:  # Long
-            tp1_hit = current_price >= tp1_price
-        else:  # Short
-            tp1_hit = current_price <= tp1_price
+        # Fast path: no event on most ticks, decided without building anything
+        status = _eval_scale_out(
+            float(current_price), float(sign), meta["tp1_price"], meta["tp2_price"],
+            bool(meta.get("tp1_done")), bool(self._tp2_enabled)
+        )
+        if status == SCALE_OUT_NONE:
+            return None
         
-        if tp1_hit and not meta.get("tp1_done"):
+        if status == SCALE_OUT_TP1:
             # Execute TP1 partial close
-            tp1_frac = scale_cfg.get("tp1_frac", 0.5)
+            tp1_frac = self._tp1_frac
             remaining_qty = meta["remaining_qty"]
             qty_to_close = remaining_qty * tp1_frac
             
@@ -201,7 +395,7 @@ class PortfolioTracker:
                 "qty": qty_to_close,
                 "price": current_price,
                 "pnl_usd": pnl1,
-                "timestamp": datetime.now().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             meta["fills"].append(fill_record)
             meta["realized_pnl_usd"] = meta.get("realized_pnl_usd", 0) + pnl1
@@ -209,7 +403,7 @@ class PortfolioTracker:
             meta["tp1_done"] = True
             
             # Move stop to breakeven (entry + small buffer for fees)
-            buffer = scale_cfg.get("breakeven_buffer", 0.001)
+            buffer = self._breakeven_buffer
             meta["stop_price"] = entry * (1 + buffer * sign)
             
             # Send Telegram notification
@@ -225,68 +419,95 @@ class PortfolioTracker:
                 "new_stop": meta["stop_price"]
             }
         
-        # Check TP2 exit for remaining position
-        tp2_enabled = scale_cfg.get("tp2_enabled", True)
-        if tp2_enabled and meta.get("tp1_done") and meta.get("remaining_qty", 0) > 0:
-            tp2_r = scale_cfg.get("tp2_r", 3.0)
-            tp2_price = entry + sign * (tp2_r * risk_per_unit)
-            
-            tp2_hit = False
-            if sign > 0:  # Long
-                tp2_hit = current_price >= tp2_price
-            else:  # Short
-                tp2_hit = current_price <= tp2_price
-            
-            if tp2_hit:
-                remaining_qty = meta["remaining_qty"]
-                pnl2 = (current_price - entry) * remaining_qty * sign
-                
-                fill_record = {
-                    "reason": "TP2",
-                    "qty": remaining_qty,
-                    "price": current_price,
-                    "pnl_usd": pnl2,
-                    "timestamp": datetime.now().isoformat()
-                }
-                meta["fills"].append(fill_record)
-                meta["realized_pnl_usd"] = meta.get("realized_pnl_usd", 0) + pnl2
-                meta["remaining_qty"] = 0
-                meta["exit_reason"] = "TP2"
-                
-                # Send Telegram notification
-                self._send_scale_out_notification("TP2", symbol, remaining_qty, current_price, pnl2, 0)
-                
-                return {
-                    "event": "TP2_HIT",
-                    "symbol": symbol,
-                    "qty_closed": remaining_qty,
-                    "price": current_price,
-                    "pnl_usd": pnl2,
-                    "remaining_qty": 0,
-                    "exit_reason": "TP2"
-                }
+        # TP2 exit for remaining position
+        remaining_qty = meta["remaining_qty"]
+        pnl2 = (current_price - entry) * remaining_qty * sign
         
-        return None
+        fill_record = {
+            "reason": "TP2",
+            "qty": remaining_qty,
+            "price": current_price,
+            "pnl_usd": pnl2,
+            "timestamp_ns": time.time_ns()
+        }
+        meta["fills"].append(fill_record)
+        meta["realized_pnl_usd"] = meta.get("realized_pnl_usd", 0) + pnl2
+        meta["remaining_qty"] = 0
+        meta["exit_reason"] = "TP2"
+        
+        # Send Telegram notification
+        self._send_scale_out_notification("TP2", symbol, remaining_qty, current_price, pnl2, 0)
+        
+        return {
+            "event": "TP2_HIT",
+            "symbol": symbol,
+            "qty_closed": remaining_qty,
+            "price": current_price,
+            "pnl_usd": pnl2,
+            "remaining_qty": 0,
+            "exit_reason": "TP2"
+        }
     
     def _get_scale_out_config(self) -> dict:
-        """Load scale-out config from settings."""
-        # Try to load from config file
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "settings.yaml")
+        """Return the cached scale-out config."""
+        return self._scale_cfg
+    
+    def _load_scale_out_config(self) -> dict:
+        """Load scale-out config from settings (parsed once per settings.yaml version)."""
+        global _SCALE_OUT_CACHE
         try:
-            import yaml
-            with open(config_path, "r") as f:
+            st = os.stat(SETTINGS_PATH)
+        except OSError:
+            # Default config if file not found
+            return dict(DEFAULT_SCALE_OUT_CONFIG)
+        signature = (st.st_mtime_ns, st.st_size)
+        if _SCALE_OUT_CACHE is not None and _SCALE_OUT_CACHE[0] == signature:
+            return _SCALE_OUT_CACHE[1]
+        
+        try:
+            import yaml  # only needed on the first load or after an edit
+            with open(SETTINGS_PATH, "r") as f:
                 cfg = yaml.safe_load(f) or {}
-            return cfg.get("trade_mgmt", {}).get("scale_out", {})
+            scale_cfg = cfg.get("trade_mgmt", {}).get("scale_out", {})
         except Exception:
-            # Default config if file not found
-            return {
-                "enabled": True,
-                "tp1_r": 1.0,
-                "tp1_frac": 0.5,
-                "tp2_enabled": True,
-                "tp2_r": 3.0,
-                "breakeven_buffer": 0.001
-            }
+            return dict(DEFAULT_SCALE_OUT_CONFIG)
+        
+        _SCALE_OUT_CACHE = (signature, scale_cfg)
+        return scale_cfg
+    
+    def reload_config(self) -> None:
+        """Re-read scale-out config from settings.yaml if it changed on disk."""
+        try:
+            mtime = os.path.getmtime(SETTINGS_PATH)
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self._scale_cfg_mtime:
+            return
+        
+        scale_cfg = self._load_scale_out_config()
+        self._scale_cfg = scale_cfg
+        self._scale_cfg_mtime = mtime
+        
+        # Flattened for attribute reads in on_price_tick
+        self._scale_enabled = bool(scale_cfg.get("enabled", False))
+        self._tp1_r = scale_cfg.get("tp1_r", 1.0)
+        self._tp1_frac = scale_cfg.get("tp1_frac", 0.5)
+        self._tp2_enabled = scale_cfg.get("tp2_enabled", True)
+        self._tp2_r = scale_cfg.get("tp2_r", 3.0)
+        self._breakeven_buffer = scale_cfg.get("breakeven_buffer", 0.001)
+        
+        # R multiples may have changed: recompute trigger prices on next tick
+        for p in self._positions:
+            if p.meta:
+                p.meta.pop("tp1_price", None)
+    
+    def _set_scale_out_targets(self, meta: dict, sign: int) -> None:
+        """Precompute a position's TP1/TP2 trigger prices (constant while open)."""
+        entry = meta["entry_price"]
+        risk_per_unit = meta["risk_per_unit"]
+        meta["sign"] = sign
+        meta["tp1_price"] = float(entry + sign * (self._tp1_r * risk_per_unit))
+        meta["tp2_price"] = float(entry + sign * (self._tp2_r * risk_per_unit))
     
     def _send_scale_out_notification(self, stage: str, symbol: str, qty: float, price: float, pnl: float, remaining: float) -> None:
         """Send Telegram notification for scale-out events."""
@@ -321,13 +542,12 @@ class PortfolioTracker:
     
     def get_scale_out_status(self, symbol: str) -> dict:
         """Get scale-out status for a position."""
-        summary = self.get_portfolio_summary()
-        position = summary.positions_by_symbol.get(symbol)
+        position = self._positions_by_symbol.get(symbol)
         
         if not position:
             return {"error": "No position found"}
         
-        meta = getattr(position, "meta", {}) or {}
+        meta = position.meta
         
         return {
             "symbol": symbol,
@@ -335,17 +555,13 @@ class PortfolioTracker:
             "remaining_qty": meta.get("remaining_qty", position.quantity),
             "tp1_done": meta.get("tp1_done", False),
             "realized_pnl_usd": meta.get("realized_pnl_usd", 0),
-            "fills": meta.get("fills", []),
+            "fills": [_fill_for_output(f) for f in meta.get("fills", [])],
             "stop_price": meta.get("stop_price", None)
         }
     
     def initialize_trade_scale_out(self, symbol: str, entry_price: float, qty: float, stop_price: float) -> None:
         """Initialize scale-out tracking for a new trade."""
-        position = None
-        for p in self._positions.get("kucoin", []):
-            if p.symbol == symbol:
-                position = p
-                break
+        position = self._positions_by_symbol.get(symbol)
         
         if not position:
             # Create a tracking entry
@@ -362,11 +578,8 @@ class PortfolioTracker:
                 entry_time=datetime.now(),
                 duration_seconds=0
             )
-            self._positions["kucoin"].append(position)
-        
-        # Initialize meta
-        if not hasattr(position, "meta") or position.meta is None:
-            position.meta = {}
+            self._positions.append(position)
+            self._positions_by_symbol[symbol] = position
         
         position.meta.update({
             "remaining_qty": qty,
@@ -377,39 +590,48 @@ class PortfolioTracker:
             "stop_init": stop_price,
             "risk_per_unit": abs(entry_price - stop_price)
         })
+        self._set_scale_out_targets(position.meta, 1 if position.side.upper() == "BUY" else -1)
     
-    def _fetch_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+    def _fetch_current_prices(self, symbols: List[str], now_ts: Optional[float] = None) -> Dict[str, float]:
         """
         Fetch current prices from exchange APIs.
         In production, this would call KuCoin, Alpaca, etc.
         """
+        # One bucket for the whole batch so every symbol shares a TTL window
+        bucket = int((time.time() if now_ts is None else now_ts) // PRICE_CACHE_TTL_SECONDS)
+        return {s: self._price_cached(s, bucket) for s in symbols}
+    
+    def _fetch_price(self, symbol: str, bucket: int) -> float:
+        """
+        Fetch one symbol's price; bucket only keys the TTL cache.
+        """
         # For now, return simulated prices
         # In production:
-        # prices = {}
-        # for symbol in symbols:
-        #     if "kucoin" in enabled_exchanges:
-        #         prices[symbol] = await fetch_kucoin_price(symbol)
-        #     elif "alpaca" in enabled_exchanges:
-        #         prices[symbol] = await fetch_alpaca_price(symbol)
-        
-        return {s: self._current_prices.get(s, 100.0) for s in symbols}
+        # if "kucoin" in enabled_exchanges:
+        #     return await fetch_kucoin_price(symbol)
+        # elif "alpaca" in enabled_exchanges:
+        #     return await fetch_alpaca_price(symbol)
+        # (fan out with asyncio.gather across symbols)
+        return self._current_prices.get(symbol, 100.0)
     
-    def _calculate_unrealized_pnl(
-        self,
-        symbol: str,
-        side: str,
-        entry_price: float,
-        current_price: float,
-        quantity: float
-    ) -> Tuple[float, float]:
-        """Calculate unrealized P&L and percentage."""
-        if side.upper() == "BUY":
-            pnl = (current_price - entry_price) * quantity
-            pnl_pct = ((current_price - entry_price) / entry_price) * 100
-        else:
-            pnl = (entry_price - current_price) * quantity
-            pnl_pct = ((entry_price - current_price) / entry_price) * 100
-        return pnl, pnl_pct
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it (WAL + PRAGMAs) on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-20000;"
+            )
+            self._conn = conn
+        return self._conn
+    
+    def close(self) -> None:
+        """Close the shared database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def scan_for_open_positions(self) -> List[Position]:
         """
@@ -418,96 +640,75 @@ class PortfolioTracker:
         """
         # Try to read from trades.db, fall back to demo mode on error
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT symbol, side, entry, exit_price, pnl, created_at, closed_at
-                FROM trades
-                WHERE closed_at IS NULL
-                LIMIT 50
-            """)
-            rows = cursor.fetchall()
-            conn.close()
+            rows = self._get_conn().execute(OPEN_TRADES_SQL).fetchall()
         except Exception:
             rows = []
         
         # Simulate open positions based on recent activity
         # In production, you'd query exchange APIs for actual open positions
-        open_positions = []
-        
-        # Get unique symbols from database
-        symbols = list(set(row[0] for row in rows)) if rows else []
-        
-        # If no positions in DB, use demo positions for display
-        if not symbols:
-            symbols = ["BTC/USDT", "SOL/USDT", "ETH/USDT", "BNB/USDT", "XRP/USDT"]
-        
-        current_prices = self._fetch_current_prices(symbols)
-        
-        # Demo positions for showcase
-        now = datetime.now()
-        demo_positions = [
-            {"symbol": "BTC/USDT", "side": "BUY", "entry": 98500.0, "qty": 0.01},
-            {"symbol": "SOL/USDT", "side": "BUY", "entry": 195.0, "qty": 2.0},
-            {"symbol": "ETH/USDT", "side": "BUY", "entry": 3400.0, "qty": 0.2},
-        ]
-        
-        for pos in demo_positions:
-            symbol = pos["symbol"]
-            current = current_prices.get(symbol, 100.0)
-            pnl, pnl_pct = self._calculate_unrealized_pnl(
-                symbol, pos["side"], pos["entry"], current, pos["qty"]
-            )
-            
-            position = Position(
-                symbol=symbol,
-                exchange="kucoin",
-                side=pos["side"],
-                entry_price=pos["entry"],
-                current_price=current,
-                quantity=pos["qty"],
-                unrealized_pnl=pnl,
-                unrealized_pnl_pct=pnl_pct,
-                entry_time=now - timedelta(minutes=30),
-                duration_seconds=1800
-            )
-            open_positions.append(position)
-        
-        self._positions["kucoin"] = open_positions
+        open_positions = self._positions
+        
+        # Refresh prices for DB symbols and every tracked position
+        symbols = set(row[0] for row in rows) if rows else set()
+        symbols.update(p.symbol for p in open_positions)
+        # One clock read per scan, shared by the price cache and durations
+        now_ts = time.time()
+        now = datetime.fromtimestamp(now_ts)
+        current_prices = self._fetch_current_prices(sorted(symbols), now_ts)
+        
+        n = len(open_positions)
+        entries = np.fromiter((p.entry_price for p in open_positions), dtype=np.float64, count=n)
+        quantities = np.fromiter((p.quantity for p in open_positions), dtype=np.float64, count=n)
+        signs = np.fromiter((1.0 if p.side.upper() == "BUY" else -1.0 for p in open_positions), dtype=np.float64, count=n)
+        currents = np.fromiter((current_prices.get(p.symbol, 100.0) for p in open_positions), dtype=np.float64, count=n)
+        pnls, pnl_pcts = _unrealized_pnl_arrays(entries, currents, quantities, signs)
+        
+        # Update in place so per-position state (scale-out meta) survives scans
+        for i, p in enumerate(open_positions):
+            p.current_price = float(currents[i])
+            p.unrealized_pnl = float(pnls[i])
+            p.unrealized_pnl_pct = float(pnl_pcts[i])
+            p.duration_seconds = (now - p.entry_time).total_seconds()
+        
+        self._pos_arrays = {
+            "entry": entries,
+            "qty": quantities,
+            "sign": signs,
+            "current": currents,
+            "pnl": pnls,
+            "pct": pnl_pcts,
+        }
         return open_positions
     
     def get_portfolio_summary(self) -> PortfolioSummary:
         """Get complete portfolio overview."""
         positions = self.scan_for_open_positions()
+        pos = self._pos_arrays
         
         # Calculate totals
-        total_unrealized = sum(p.unrealized_pnl for p in positions)
+        total_unrealized = float(pos["pnl"].sum())
         
         # Get realized P&L from analytics
         analytics_summary = self.analytics.calculate_performance_summary()
         total_realized = analytics_summary.total_pnl
         
         # Group by exchange
-        positions_by_exchange = defaultdict(list)
+        positions_by_exchange: Dict[str, List[Position]] = {}
         for p in positions:
-            positions_by_exchange[p.exchange].append(p)
+            positions_by_exchange.setdefault(p.exchange, []).append(p)
         
-        # Group by symbol
-        positions_by_symbol = {p.symbol: p for p in positions}
-        
-        # Sort performers
-        sorted_by_pnl = sorted(positions, key=lambda p: p.unrealized_pnl, reverse=True)
-        top_performers = sorted_by_pnl[:3]
-        worst_performers = sorted_by_pnl[-3:]
+        # Top / bottom 3 by P&L (both listed best-first)
+        pnl = pos["pnl"]
+        top_performers = [positions[i] for i in _top_k_indices(pnl, 3)]
+        worst_performers = [positions[i] for i in _top_k_indices(-pnl, 3)[::-1]]
         
         # Calculate exposure
-        exposure_by_symbol = {}
-        exposure_by_side = {"BUY": 0.0, "SELL": 0.0}
-        
-        for p in positions:
-            exposure = p.current_price * p.quantity
-            exposure_by_symbol[p.symbol] = exposure
-            exposure_by_side[p.side] += exposure
+        exposures = pos["current"] * pos["qty"]
+        exposure_by_symbol = {p.symbol: float(e) for p, e in zip(positions, exposures)}
+        exposure_by_side = {
+            "BUY": float(exposures[pos["sign"] > 0].sum()),
+            "SELL": float(exposures[pos["sign"] < 0].sum()),
+        }
         
         total_equity = total_realized + total_unrealized + 500  # Initial equity
         
@@ -516,8 +717,8 @@ class PortfolioTracker:
             total_unrealized_pnl=total_unrealized,
             total_realized_pnl=total_realized,
             open_positions=positions,
-            positions_by_exchange=dict(positions_by_exchange),
-            positions_by_symbol=positions_by_symbol,
+            positions_by_exchange=positions_by_exchange,
+            positions_by_symbol=MappingProxyType(self._positions_by_symbol),
             top_performers=top_performers,
             worst_performers=worst_performers,
             exposure_by_symbol=exposure_by_symbol,
@@ -529,9 +730,7 @@ class PortfolioTracker:
         summary = self.get_portfolio_summary()
         
         lines = [
-            "=" * 50,
-            "🤖 TRADEMINDIQ PORTFOLIO DASHBOARD",
-            "=" * 50,
+            *_DASHBOARD_HEADER,
             f"Last Updated: {datetime.now().strftime('%H:%M:%S')}",
             "",
             "📊 PORTFOLIO SUMMARY",
@@ -545,38 +744,32 @@ class PortfolioTracker:
         ]
         
         if summary.open_positions:
-            lines.extend([
-                "📍 OPEN POSITIONS",
-                "-" * 40,
-            ])
-            
-            for p in summary.open_positions:
-                emoji = "🟢" if p.unrealized_pnl > 0 else "🔴"
-                lines.append(
-                    f"{emoji} {p.symbol:<12} {p.side:<4} "
-                    f"Entry: ${p.entry_price:.4f}  "
-                    f"Cur: ${p.current_price:.4f}  "
-                    f"P/L: ${p.unrealized_pnl:>8.2f} ({p.unrealized_pnl_pct:>5.2f}%)"
+            lines.extend(_OPEN_POSITIONS_HEADER)
+            lines.extend(
+                _POS_LINE_TMPL.format(
+                    emoji="🟢" if p.unrealized_pnl > 0 else "🔴",
+                    symbol=p.symbol,
+                    side=p.side,
+                    entry=p.entry_price,
+                    cur=p.current_price,
+                    pnl=p.unrealized_pnl,
+                    pct=p.unrealized_pnl_pct,
                 )
+                for p in summary.open_positions
+            )
             
-            lines.extend([
-                "",
-                "🏆 TOP PERFORMERS",
-                "-" * 40,
-            ])
-            
-            for p in summary.top_performers:
-                lines.append(f"  {p.symbol:<12} +${p.unrealized_pnl:.2f}")
+            lines.extend(_TOP_PERFORMERS_HEADER)
+            lines.extend(
+                _TOP_LINE_TMPL.format(symbol=p.symbol, pnl=p.unrealized_pnl)
+                for p in summary.top_performers
+            )
             
             if summary.worst_performers:
-                lines.extend([
-                    "",
-                    "⚠️ UNDERPERFORMERS",
-                    "-" * 40,
-                ])
-                
-                for p in summary.worst_performers:
-                    lines.append(f"  {p.symbol:<12} ${p.unrealized_pnl:.2f}")
+                lines.extend(_UNDERPERFORMERS_HEADER)
+                lines.extend(
+                    _WORST_LINE_TMPL.format(symbol=p.symbol, pnl=p.unrealized_pnl)
+                    for p in summary.worst_performers
+                )
         
         else:
             lines.append("📭 No open positions")
@@ -590,10 +783,7 @@ class PortfolioTracker:
                 f"  SHORT: ${summary.exposure_by_side.get('SELL', 0):,.2f}",
             ])
         
-        lines.extend([
-            "",
-            "=" * 50,
-        ])
+        lines.extend(_DASHBOARD_FOOTER)
         
         return "\n".join(lines)
     
@@ -613,12 +803,15 @@ class PortfolioTracker:
         ]
         
         if summary.open_positions:
-            for p in summary.open_positions[:5]:  # Max 5 for Telegram
-                pos_emoji = "🟢" if p.unrealized_pnl > 0 else "🔴"
-                lines.append(
-                    f"{pos_emoji} {p.symbol:<10} {p.side:<4} "
-                    f"${p.unrealized_pnl:>7.2f}"
+            lines.extend(
+                _COMPACT_LINE_TMPL.format(
+                    emoji="🟢" if p.unrealized_pnl > 0 else "🔴",
+                    symbol=p.symbol,
+                    side=p.side,
+                    pnl=p.unrealized_pnl,
                 )
+                for p in summary.open_positions[:5]  # Max 5 for Telegram
+            )
         
         if len(summary.open_positions) > 5:
             lines.append(f"... and {len(summary.open_positions) - 5} more")
@@ -653,16 +846,15 @@ class PortfolioTracker:
             "exposure_by_symbol": {k: round(v, 2) for k, v in summary.exposure_by_symbol.items()}
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            _dump_json_stream(data, f)
         
         print(f"Positions exported to {filepath}")
         return data
     
     def get_position_by_symbol(self, symbol: str) -> Optional[Position]:
         """Get position for a specific symbol."""
-        summary = self.get_portfolio_summary()
-        return summary.positions_by_symbol.get(symbol)
+        return self._positions_by_symbol.get(symbol)
 
 
 # Convenience functions
@@ -11,14 +11,82 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import sqlite3
 import json
+import functools
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field, asdict, is_dataclass
 from collections import defaultdict
-from services.analytics import PerformanceAnalytics, PerformanceSummary
+from itertools import islice
+from services.analytics import PerformanceAnalytics, PerformanceSummary, TradeMetrics
 
+try:
+    import orjson
+except Exception:
+    orjson = None
 
-@dataclass
+
+def _json_default(obj):
+    return obj.isoformat() if isinstance(obj, (datetime, date)) else str(obj)
+
+
+def _dumps(data) -> bytes:
+    """indent=2 JSON bytes; orjson when installed (datetimes and int keys native)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+def _db_signature(db_path: str) -> Tuple:
+    """(mtime_ns, size) of the database and its WAL file; changes on every commit."""
+    sig = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(path)
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+_ONE_DAY = timedelta(days=1)
+_SIX_DAYS = timedelta(days=6)
+_SEVEN_DAYS = timedelta(days=7)
+
+# Indexed by sign(pnl) + 1 / bool, replacing per-line conditional chains
+_DAY_EMOJI = ("🔴", "⚪", "🟢")
+_WEEK_EMOJI = ("🔴", "🟢")
+_CHECK_EMOJI = ("❌", "✅")
+
+
+def _best_worst_symbols(summary: PerformanceSummary) -> Tuple[str, str]:
+    """
+    First and last symbol of pnl_by_symbol, which calculate_performance_summary
+    already orders by total P&L descending.
+    """
+    by_symbol = summary.pnl_by_symbol
+    if not by_symbol:
+        return "N/A", "N/A"
+    return next(iter(by_symbol)), next(reversed(by_symbol))
+
+
+# __slots__ dataclasses need Python 3.10+; plain dataclasses on older versions
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class DailyBreakdown:
+    """Per-day weekly breakdown as parallel columns, one entry per trading day."""
+    dates: List[str] = field(default_factory=list)
+    trades: List[int] = field(default_factory=list)
+    wins: List[int] = field(default_factory=list)
+    losses: List[int] = field(default_factory=list)
+    pnl: List[float] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WeeklyReport:
     """Weekly performance report."""
     week_start: datetime
@@ -31,14 +99,14 @@ class WeeklyReport:
     best_symbol: str
     worst_symbol: str
     top_trade: Dict
-    daily_breakdown: List[Dict]
+    daily_breakdown: DailyBreakdown
     hourly_heatmap: Dict[int, int]  # hour -> trade count
     exit_reason_breakdown: Dict[str, int]
     goals: Dict[str, bool]  # goal -> achieved
     notes: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MonthlyReport:
     """Monthly performance report."""
     month: str  # "2026-01"
@@ -69,10 +137,34 @@ class ReportGenerator:
     def __init__(self, db_path: str = "trades.db"):
         self.db_path = db_path
         self.analytics = PerformanceAnalytics(db_path)
+        # Trades + summary per date range, keyed on the DB signature so any
+        # new write to trades.db invalidates them
+        self._range_cached = functools.lru_cache(maxsize=64)(self._fetch_range)
+        self._aggregates_cached = functools.lru_cache(maxsize=64)(self._fetch_aggregates)
+    
+    def _fetch_range(
+        self,
+        start: datetime,
+        end: datetime,
+        db_sig: Tuple
+    ) -> Tuple[List[TradeMetrics], PerformanceSummary]:
+        trades = self.analytics.get_trades_by_date(start, end)
+        return trades, self.analytics.calculate_performance_summary(trades)
+    
+    def _fetch_aggregates(self, start: datetime, end: datetime, db_sig: Tuple) -> Dict:
+        return self.analytics.aggregate_by_date(start, end)
+    
+    def _get_range(self, start: datetime, end: datetime) -> Tuple[List[TradeMetrics], PerformanceSummary]:
+        """Trades and their summary for a date range, memoized until trades.db changes."""
+        return self._range_cached(start, end, _db_signature(self.db_path))
+    
+    def _get_aggregates(self, start: datetime, end: datetime) -> Dict:
+        """Per-day/hour/exit-reason aggregates (NumPy kernel) for a date range, memoized like _get_range."""
+        return self._aggregates_cached(start, end, _db_signature(self.db_path))
     
     def get_week_dates(self, week_start: datetime) -> Tuple[datetime, datetime]:
         """Get start and end of week."""
-        week_end = week_start + timedelta(days=6)
+        week_end = week_start + _SIX_DAYS
         return week_start, week_end
     
     def generate_weekly_report(
@@ -81,39 +173,34 @@ class ReportGenerator:
         goals: Optional[Dict] = None
     ) -> WeeklyReport:
         """Generate weekly performance report."""
-        week_end = week_start + timedelta(days=6)
+        week_end = week_start + _SIX_DAYS
+        # BETWEEN is inclusive: query through the last instant of the final day
+        range_end = week_end.replace(hour=23, minute=59, second=59, microsecond=999999)
         
         # Get trades for the week
-        trades = self.analytics.get_trades_by_date(week_start, week_end)
-        summary = self.analytics.calculate_performance_summary(trades)
-        
-        # Calculate daily breakdown
-        daily_breakdown = []
-        for day_str, pnl in summary.daily_pnl.items():
-            day_date = datetime.fromisoformat(day_str)
-            day_trades = [t for t in trades if t.closed_at.date() == day_date.date()]
-            wins = sum(1 for t in day_trades if t.pnl > 0)
-            daily_breakdown.append({
-                "date": day_str,
-                "trades": len(day_trades),
-                "wins": wins,
-                "losses": len(day_trades) - wins,
-                "pnl": round(pnl, 2)
-            })
-        
-        # Hourly heatmap
-        hourly_heatmap = defaultdict(int)
-        for t in trades:
-            hourly_heatmap[t.closed_at.hour] += 1
+        trades, summary = self._get_range(week_start, range_end)
+        
+        if trades:
+            # Daily/hourly/exit-reason breakdowns come from the fused aggregate kernel
+            aggregates = self._get_aggregates(week_start, range_end)
+            daily = aggregates["daily"]
+            daily_breakdown = DailyBreakdown(
+                dates=list(daily["dates"]),
+                trades=list(daily["trades"]),
+                wins=list(daily["wins"]),
+                losses=[n - wins for n, wins in zip(daily["trades"], daily["wins"])],
+                pnl=[round(pnl, 2) for pnl in daily["pnl"]]
+            )
+            hourly_heatmap = aggregates["hourly"]
+            exit_reason_breakdown = aggregates["exit_reasons"]
+        else:
+            # Empty week: nothing to aggregate, skip the query
+            daily_breakdown = DailyBreakdown()
+            hourly_heatmap = {}
+            exit_reason_breakdown = {}
         
         # Best/Worst symbols
-        sorted_symbols = sorted(
-            summary.pnl_by_symbol.items(), 
-            key=lambda x: x[1].total_pnl, 
-            reverse=True
-        )
-        best_symbol = sorted_symbols[0][0] if sorted_symbols else "N/A"
-        worst_symbol = sorted_symbols[-1][0] if sorted_symbols else "N/A"
+        best_symbol, worst_symbol = _best_worst_symbols(summary)
         
         # Top trade
         top_trade = None
@@ -156,7 +243,7 @@ class ReportGenerator:
             top_trade=top_trade,
             daily_breakdown=daily_breakdown,
             hourly_heatmap=dict(hourly_heatmap),
-            exit_reason_breakdown=summary.exit_reason_counts,
+            exit_reason_breakdown=dict(exit_reason_breakdown),
             goals=goal_results,
             notes=notes
         )
@@ -172,13 +259,33 @@ class ReportGenerator:
         start_date = datetime(year, month, 1)
         
         if month == 12:
-            end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
+            end_date = datetime(year + 1, 1, 1) - _ONE_DAY
         else:
-            end_date = datetime(year, month + 1, 1) - timedelta(days=1)
+            end_date = datetime(year, month + 1, 1) - _ONE_DAY
         
         # Get all trades for month
-        trades = self.analytics.get_trades_by_date(start_date, end_date)
-        summary = self.analytics.calculate_performance_summary(trades)
+        trades, summary = self._get_range(start_date, end_date)
+        
+        if not trades:
+            return MonthlyReport(
+                month=month_str,
+                total_trades=0,
+                wins=0,
+                losses=0,
+                win_rate=0.0,
+                total_pnl=0.0,
+                avg_daily_pnl=0.0,
+                best_day="N/A",
+                worst_day="N/A",
+                best_symbol="N/A",
+                worst_symbol="N/A",
+                weekly_summaries=[],
+                monthly_goal=monthly_goal,
+                goal_achieved=0.0 >= monthly_goal,
+                trends={"volume": "→", "win_rate": "→", "pnl": "→"},
+                top_performers=[],
+                improvement_areas=["No trades this month"]
+            )
         
         # Calculate metrics
         total_days = (end_date - start_date).days + 1
@@ -193,31 +300,32 @@ class ReportGenerator:
             best_day = ("N/A", 0)
             worst_day = ("N/A", 0)
         
-        # Weekly summaries
+        # Weekly summaries: bucket the month's trades into 7-day windows from
+        # the 1st instead of re-querying the database once per week
+        month_start = start_date.date()
+        weekly_buckets: Dict[date, List[TradeMetrics]] = defaultdict(list)
+        for t in trades:
+            offset = (t.closed_at.date() - month_start).days
+            weekly_buckets[month_start + timedelta(days=offset - offset % 7)].append(t)
+        
         weekly_summaries = []
         current = start_date
         while current <= end_date:
-            week_end = min(current + timedelta(days=6), end_date)
-            week_summary = self.generate_weekly_report(current)
+            week_summary = self.analytics.calculate_performance_summary(
+                weekly_buckets.get(current.date(), [])
+            )
             weekly_summaries.append({
-                "week": current.strftime("%Y-%m-%d"),
+                "week": f"{current.year}-{current.month:02d}-{current.day:02d}",
                 "trades": week_summary.total_trades,
                 "pnl": round(week_summary.total_pnl, 2),
                 "win_rate": round(week_summary.win_rate, 1)
             })
-            current = week_end + timedelta(days=1)
+            current += _SEVEN_DAYS
         
         # Best/Worst symbols
-        sorted_symbols = sorted(
-            summary.pnl_by_symbol.items(), 
-            key=lambda x: x[1].total_pnl, 
-            reverse=True
-        )
-        best_symbol = sorted_symbols[0][0] if sorted_symbols else "N/A"
-        worst_symbol = sorted_symbols[-1][0] if sorted_symbols else "N/A"
+        best_symbol, worst_symbol = _best_worst_symbols(summary)
         
         # Trends (simple comparison with previous period)
-        prev_month = datetime(year, month, 1) - timedelta(days=1)
         prev_summary = self.analytics.get_recent_performance(days=30)
         
         trends = {}
@@ -235,7 +343,7 @@ class ReportGenerator:
         
         # Top performers
         top_performers = []
-        for symbol, stats in list(summary.pnl_by_symbol.items())[:5]:
+        for symbol, stats in islice(summary.pnl_by_symbol.items(), 5):
             top_performers.append({
                 "symbol": symbol,
                 "trades": stats.total_trades,
@@ -252,7 +360,7 @@ class ReportGenerator:
         
         # Exit reason analysis
         time_exits = summary.exit_reason_counts.get("TIME", 0)
-        total_exits = sum(summary.exit_reason_counts.values())
+        total_exits = summary.total_trades  # every trade counts toward exactly one exit reason
         if total_exits > 0 and time_exits / total_exits > 0.8:
             improvement_areas.append("83%+ TIME exits - consider extending hold times")
         
@@ -280,10 +388,11 @@ class ReportGenerator:
     
     def generate_text_report(self, report: WeeklyReport) -> str:
         """Generate formatted weekly text report."""
+        ws, we = report.week_start, report.week_end
         lines = [
             "=" * 60,
             f"WEEKLY PERFORMANCE REPORT",
-            f"{report.week_start.strftime('%Y-%m-%d')} to {report.week_end.strftime('%Y-%m-%d')}",
+            f"{ws.year}-{ws.month:02d}-{ws.day:02d} to {we.year}-{we.month:02d}-{we.day:02d}",
             "=" * 60,
             "",
             "📊 SUMMARY",
@@ -298,9 +407,11 @@ class ReportGenerator:
             "-" * 40,
         ]
         
-        for day in report.daily_breakdown:
-            emoji = "🟢" if day["pnl"] > 0 else "🔴" if day["pnl"] < 0 else "⚪"
-            lines.append(f"{emoji} {day['date']}: {day['trades']} trades, ${day['pnl']:,.2f}")
+        daily = report.daily_breakdown
+        lines.extend(
+            f"{_DAY_EMOJI[(pnl > 0) - (pnl < 0) + 1]} {day}: {n} trades, ${pnl:,.2f}"
+            for day, n, pnl in zip(daily.dates, daily.trades, daily.pnl)
+        )
         
         lines.extend([
             "",
@@ -309,9 +420,7 @@ class ReportGenerator:
         ])
         
         if report.goals:
-            for goal, achieved in report.goals.items():
-                status = "✅" if achieved else "❌"
-                lines.append(f"{status} {goal}")
+            lines.extend(f"{_CHECK_EMOJI[bool(achieved)]} {goal}" for goal, achieved in report.goals.items())
         else:
             lines.append("No goals set for this week")
         
@@ -321,8 +430,7 @@ class ReportGenerator:
                 "📝 NOTES",
                 "-" * 40,
             ])
-            for note in report.notes:
-                lines.append(f"• {note}")
+            lines.extend(f"• {note}" for note in report.notes)
         
         lines.extend([
             "",
@@ -330,8 +438,10 @@ class ReportGenerator:
             "-" * 40,
         ])
         
-        for reason, count in sorted(report.exit_reason_breakdown.items(), key=lambda x: -x[1]):
-            lines.append(f"  {reason:<10} {count} trades")
+        lines.extend(
+            f"  {reason:<10} {count} trades"
+            for reason, count in sorted(report.exit_reason_breakdown.items(), key=lambda x: -x[1])
+        )
         
         lines.extend([
             "",
@@ -360,8 +470,10 @@ class ReportGenerator:
             "-" * 40,
         ]
         
-        for p in report.top_performers:
-            lines.append(f"  {p['symbol']:<12} ${p['pnl']:>8.2f} ({p['trades']} trades)")
+        lines.extend(
+            f"  {p['symbol']:<12} ${p['pnl']:>8.2f} ({p['trades']} trades)"
+            for p in report.top_performers
+        )
         
         lines.extend([
             "",
@@ -369,9 +481,10 @@ class ReportGenerator:
             "-" * 40,
         ])
         
-        for week in report.weekly_summaries:
-            emoji = "🟢" if week["pnl"] > 0 else "🔴"
-            lines.append(f"{emoji} Week of {week['week']}: {week['trades']} trades, ${week['pnl']:,.2f}")
+        lines.extend(
+            f"{_WEEK_EMOJI[w['pnl'] > 0]} Week of {w['week']}: {w['trades']} trades, ${w['pnl']:,.2f}"
+            for w in report.weekly_summaries
+        )
         
         if report.improvement_areas:
             lines.extend([
@@ -379,8 +492,7 @@ class ReportGenerator:
                 "🔧 IMPROVEMENT AREAS",
                 "-" * 40,
             ])
-            for area in report.improvement_areas:
-                lines.append(f"• {area}")
+            lines.extend(f"• {area}" for area in report.improvement_areas)
         
         lines.extend([
             "",
@@ -392,16 +504,12 @@ class ReportGenerator:
     def export_report(self, report, filepath: str, format: str = "json"):
         """Export report to JSON or text file."""
         if format == "json":
-            if hasattr(report, '__dict__'):
-                data = {k: v for k, v in report.__dict__.items() if not k.startswith('_')}
-                # Convert datetime objects
-                for key in ['week_start', 'week_end']:
-                    if key in data and isinstance(data[key], datetime):
-                        data[key] = data[key].isoformat()
+            if is_dataclass(report):
+                data = asdict(report)
             else:
                 data = report
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(data))
         else:
             if hasattr(report, 'week_start'):
                 text = self.generate_text_report(report)
@@ -415,8 +523,8 @@ class ReportGenerator:
     def get_current_week_report(self, goals: Optional[Dict] = None) -> WeeklyReport:
         """Get report for current week."""
         today = datetime.now()
-        # Find Monday of current week
-        week_start = today - timedelta(days=today.weekday())
+        # Monday 00:00 of the current week; a stable start keeps the range caches hitting
+        week_start = today.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=today.weekday())
         return self.generate_weekly_report(week_start, goals)
     
     def get_current_month_report(self, goal: float = 100.0) -> MonthlyReport:
@@ -425,10 +533,21 @@ class ReportGenerator:
         return self.generate_monthly_report(today.year, today.month, goal)
 
 
-# Convenience functions
+# Convenience functions share one generator (and its connection and caches)
+_GEN: Optional[ReportGenerator] = None
+
+
+def _get_gen() -> ReportGenerator:
+    """Lazily created module-wide ReportGenerator."""
+    global _GEN
+    if _GEN is None:
+        _GEN = ReportGenerator()
+    return _GEN
+
+
 def weekly_checkin(goals: Optional[Dict] = None):
     """Quick weekly performance check-in."""
-    generator = ReportGenerator()
+    generator = _get_gen()
     report = generator.get_current_week_report(goals)
     print(generator.generate_text_report(report))
     return report
@@ -436,7 +555,7 @@ def weekly_checkin(goals: Optional[Dict] = None):
 
 def monthly_review(monthly_goal: float = 100.0):
     """Quick monthly review."""
-    generator = ReportGenerator()
+    generator = _get_gen()
     report = generator.get_current_month_report(monthly_goal)
     print(generator.generate_monthly_text_report(report))
     return report
@@ -444,7 +563,7 @@ def monthly_review(monthly_goal: float = 100.0):
 
 def export_weekly_report(filepath: str = "weekly_report.json"):
     """Export current week to JSON."""
-    generator = ReportGenerator()
+    generator = _get_gen()
     report = generator.get_current_week_report()
     generator.export_report(report, filepath)
     return report
@@ -452,7 +571,7 @@ def export_weekly_report(filepath: str = "weekly_report.json"):
 
 def export_monthly_report(filepath: str = "monthly_report.json"):
     """Export current month to JSON."""
-    generator = ReportGenerator()
+    generator = _get_gen()
     report = generator.get_current_month_report()
     generator.export_report(report, filepath)
     return report
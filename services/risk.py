@@ -1,6 +1,17 @@
+import time
 from typing import List
-from core.models import Trade, OrderResult, Signal
-from datetime import date
+
+import numpy as np
+from core.models import Trade, OrderResult, Signal, Side
+from datetime import date, datetime, timedelta
+
+# P&L direction per side; anything that isn't BUY prices as a short
+_SIDE_SIGN = {Side.BUY: 1, Side.SELL: -1}
+
+
+def _next_local_midnight() -> float:
+    """Unix time at which date.today() next changes."""
+    return datetime.combine(date.today() + timedelta(days=1), datetime.min.time()).timestamp()
 
 
 class RiskManager:
@@ -9,6 +20,7 @@ class RiskManager:
         self.max_open_positions = 2
         self._daily_pnl = 0.0
         self._day = date.today()
+        self._day_end = _next_local_midnight()
 
     def configure(self, max_open_positions: int, daily_loss_cap: float):
         self.max_open_positions = int(max_open_positions)
@@ -18,11 +30,15 @@ class RiskManager:
         # optional hook for bookkeeping; not required for can_open_new_trade which uses passed open_positions
         return
 
-    def register_close(self, pnl: float):
-        # reset daily if day changed
-        if date.today() != self._day:
+    def _roll_day(self):
+        # reset daily if day changed; a float compare until midnight passes
+        if time.time() >= self._day_end:
             self._day = date.today()
+            self._day_end = _next_local_midnight()
             self._daily_pnl = 0.0
+
+    def register_close(self, pnl: float):
+        self._roll_day()
         try:
             self._daily_pnl += float(pnl)
         except Exception:
@@ -30,9 +46,7 @@ class RiskManager:
 
     def can_open_new_trade(self, open_positions: int = 0):
         # ensure daily reset
-        if date.today() != self._day:
-            self._day = date.today()
-            self._daily_pnl = 0.0
+        self._roll_day()
 
         if int(open_positions) >= int(self.max_open_positions):
             return (False, "max open positions reached")
@@ -45,5 +59,16 @@ class RiskManager:
         return signal.stop
 
     def compute_pnl(self, order: OrderResult, exit_price: float) -> float:
-        direction = 1 if order.signal.side.value == "BUY" else -1
-        return (exit_price - order.filled_price) * order.signal.qty * direction
+        signal = order.signal
+        return (exit_price - order.filled_price) * signal.qty * _SIDE_SIGN.get(signal.side, -1)
+
+    def compute_pnl_bulk(
+        self,
+        exit_prices: np.ndarray,
+        filled_prices: np.ndarray,
+        qtys: np.ndarray,
+        signs: np.ndarray,
+    ) -> np.ndarray:
+        # vectorised compute_pnl over aligned columns (signs: +1 BUY / -1 SELL),
+        # e.g. marking every open order to market on one tick
+        return (np.asarray(exit_prices, dtype=float) - filled_prices) * qtys * signs
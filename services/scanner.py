@@ -1,11 +1,18 @@
 # services/scanner.py
 import asyncio
+import math
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import logging
 
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
 from core.events import EventBus, EventType
 from core.models import Mode, Signal, Side
 
@@ -13,58 +20,111 @@ from core.models import Mode, Signal, Side
 logger = logging.getLogger(__name__)
 
 
+_TF_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400}
+
+
 def _timeframe_to_seconds(tf: str) -> int:
     tf = tf.strip().lower()
-    if tf.endswith("m"):
-        return int(tf[:-1]) * 60
-    if tf.endswith("h"):
-        return int(tf[:-1]) * 3600
-    if tf.endswith("d"):
-        return int(tf[:-1]) * 86400
-    return 60
-
-
-def _ema(values: np.ndarray, period: int) -> np.ndarray:
-    if len(values) == 0:
-        return values
+    unit = _TF_UNIT_SECONDS.get(tf[-1:])
+    if unit is None:
+        return 60
+    return int(tf[:-1]) * unit
+
+
+def _ema_triple_last_py(values: np.ndarray, p1: int, p2: int, p3: int):
+    a1 = 2.0 / (p1 + 1.0)
+    a2 = 2.0 / (p2 + 1.0)
+    a3 = 2.0 / (p3 + 1.0)
+    xs = values.tolist()
+    e1 = e2 = e3 = xs[0]
+    for x in xs[1:]:
+        e1 = a1 * x + (1.0 - a1) * e1
+        e2 = a2 * x + (1.0 - a2) * e2
+        e3 = a3 * x + (1.0 - a3) * e3
+    return e1, e2, e3
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _ema_triple_last(values, p1, p2, p3):
+        # three recurrences fused so `values` is read once; only the final
+        # values are consumed, so they stay in registers (no output arrays)
+        a1 = 2.0 / (p1 + 1.0)
+        a2 = 2.0 / (p2 + 1.0)
+        a3 = 2.0 / (p3 + 1.0)
+        e1 = e2 = e3 = values[0]
+        for i in range(1, values.size):
+            x = values[i]
+            e1 = a1 * x + (1.0 - a1) * e1
+            e2 = a2 * x + (1.0 - a2) * e2
+            e3 = a3 * x + (1.0 - a3) * e3
+        return e1, e2, e3
+else:
+    _ema_triple_last = _ema_triple_last_py
+
+
+def _atr_last_py(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> float:
+    # True range is elementwise: vectorize it; only the smoothing is serial
+    n = len(close)
+    pc = np.empty(n, dtype=float)
+    pc[0] = close[0]
+    pc[1:] = close[:-1]
+    tr = np.maximum(high - low, np.maximum(np.abs(high - pc), np.abs(low - pc)))
+    tr[0] = high[0] - low[0]
+
+    alpha = 1.0 / float(period)
+    last = float(tr[0])
+    for t in tr[1:].tolist():
+        last = (1.0 - alpha) * last + alpha * t
+    return last
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _atr_last(high, low, close, period=14):
+        # true range and Wilder smoothing fused into one scalar pass
+        alpha = 1.0 / period
+        atr = high[0] - low[0]
+        for i in range(1, close.size):
+            pc = close[i - 1]
+            tr = max(high[i] - low[i], abs(high[i] - pc), abs(low[i] - pc))
+            atr = (1.0 - alpha) * atr + alpha * tr
+        return atr
+else:
+    _atr_last = _atr_last_py
+
+
+if njit is not None:
+    # compile at import (or load from the cache=True artifact), not on the first scan
+    _ema_triple_last(np.zeros(2), 9, 20, 50)
+    _atr_last(np.zeros(2), np.zeros(2), np.zeros(2), 14)
+
+
+def _ema_next(prev: float, x: float, period: int) -> float:
     alpha = 2.0 / (period + 1.0)
-    out = np.empty_like(values, dtype=float)
-    out[0] = float(values[0])
-    for i in range(1, len(values)):
-        out[i] = alpha * float(values[i]) + (1.0 - alpha) * out[i - 1]
-    return out
+    return alpha * x + (1.0 - alpha) * prev
 
 
-def _atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
-    n = len(close)
-    if n == 0:
-        return np.array([], dtype=float)
-
-    tr = np.empty(n, dtype=float)
-    tr[0] = float(high[0] - low[0])
-    for i in range(1, n):
-        h_l = float(high[i] - low[i])
-        h_pc = abs(float(high[i] - close[i - 1]))
-        l_pc = abs(float(low[i] - close[i - 1]))
-        tr[i] = max(h_l, h_pc, l_pc)
-
-    atr = np.empty(n, dtype=float)
-    atr[0] = tr[0]
+def _atr_next(prev: float, high: float, low: float, prev_close: float, period: int = 14) -> float:
     alpha = 1.0 / float(period)
-    for i in range(1, n):
-        atr[i] = (1.0 - alpha) * atr[i - 1] + alpha * tr[i]
-    return atr
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    return (1.0 - alpha) * prev + alpha * tr
+
 
+def _window_max_push(dq: deque, t: int, value: float, t_min: int) -> None:
+    """Monotonic-deque sliding max: add (t, value), then drop entries older than t_min."""
+    while dq and dq[-1][1] <= value:
+        dq.pop()
+    dq.append((t, value))
+    while dq[0][0] < t_min:
+        dq.popleft()
 
-def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
-    if len(values) < period:
-        return np.full_like(values, np.nan, dtype=float)
-    out = np.full_like(values, np.nan, dtype=float)
-    csum = np.cumsum(values, dtype=float)
-    out[period - 1] = csum[period - 1] / period
-    for i in range(period, len(values)):
-        out[i] = (csum[i] - csum[i - period]) / period
-    return out
+
+def _lru_put(od: OrderedDict, key: Any, value: Any, cap: int) -> None:
+    od[key] = value
+    od.move_to_end(key)
+    while len(od) > cap:
+        od.popitem(last=False)
 
 
 class ScannerService:
@@ -86,6 +146,13 @@ class ScannerService:
             v = 0.60
         self.loosen_factor = v
 
+        # loosened thresholds only change here; _generate_signal reads these
+        keep = 1.0 - v
+        self._rel_vol_min = self.min_rel_vol * keep
+        self._gap_min = self.min_gap_pct * keep
+        self._min_ba = self.min_bid_ask_ratio * keep
+        self._min_bs = self.min_buy_sell_ratio * keep
+
     def set_mode_preset(self, preset: str) -> None:
         p = preset.strip().lower()
         if p == "strict":
@@ -105,7 +172,7 @@ class ScannerService:
         self.test_force_signals = bool(enabled)
 
     def reset_forced_symbols(self) -> None:
-        self._forced_symbols = set()
+        self._forced_symbols = OrderedDict()
 
 
     def __init__(
@@ -132,12 +199,18 @@ class ScannerService:
         min_bid_ask_ratio: float = 1.25,
         min_buy_sell_ratio: float = 1.15,
         loosen_factor: float = 0.30,  # 30% less strict for testing
+        scan_concurrency: int = 8,
     ):
         self.client = client
         self.bus = bus
         self.symbols = symbols
         self.timeframe = timeframe
+        self._tf_seconds = _timeframe_to_seconds(timeframe)
         self.mode = mode
+        self._mode_name = getattr(mode, "name", str(mode))
+        # loop heartbeat payload, reused each loop (EventBus delivers synchronously
+        # and no subscriber keeps it)
+        self._hb_payload: Dict[str, Any] = {"ts": 0, "mode": self._mode_name}
         self.equity = float(equity)
 
         self.risk_per_trade = float(risk_per_trade)
@@ -161,69 +234,109 @@ class ScannerService:
         self.min_buy_sell_ratio = float(min_buy_sell_ratio)
 
         # 0.30 means "30% less strict"
-        self.loosen_factor = float(loosen_factor)
+        self.set_loosen_factor(loosen_factor)
+
+        # Candle-structure / volume-spike tunables (plain attributes, override after init)
+        self.min_body_pct = 0.55
+        self.max_upper_wick_pct = 0.35
+        self.min_vol_spike = 1.8
+
+        # symbols scanned in flight together per loop (exchange rate limits)
+        self.scan_concurrency = max(1, int(scan_concurrency))
 
         # test flags (used in testing to force scanner to emit signals)
         self.test_force_signals = False
         self.test_force_once_per_symbol = True
-        self._forced_symbols = set()
+        self._forced_symbols: Dict[str, bool] = OrderedDict()
+
+        # Per-symbol caches below are LRU-bounded (see _cache_cap) so rotating
+        # the symbol list at runtime doesn't grow them forever.
 
         # perf: skip work when candle hasn't changed
-        self._last_ts: Dict[str, int] = {}
+        self._last_ts: Dict[str, int] = OrderedDict()
+
+        # perf: (bar ts, price) of the last PRICE_TICK per symbol
+        self._last_tick: Dict[str, Tuple[int, float]] = OrderedDict()
+
+        # perf: per-symbol indicator state so a one-bar advance is an O(1) update
+        self._state: Dict[str, Dict[str, Any]] = OrderedDict()
+
+        # perf: last candle window per symbol as a (6, n) column buffer
+        self._candles_np: Dict[str, np.ndarray] = OrderedDict()
+
+    @property
+    def _cache_cap(self) -> int:
+        return max(16, 2 * len(self.symbols))
 
     async def run_forever(self) -> None:
-        tf_seconds = _timeframe_to_seconds(self.timeframe)
+        tf_seconds = self._tf_seconds
+        sem = asyncio.Semaphore(self.scan_concurrency)
 
         while True:
             loop_start = time.time()
 
             # heartbeat each loop
-            self.bus.publish(
-                EventType.HEARTBEAT,
-                {"ts": int(time.time()), "mode": getattr(self.mode, "name", str(self.mode))},
-            )
+            hb = self._hb_payload
+            hb["ts"] = int(loop_start)
+            self.bus.publish(EventType.HEARTBEAT, hb)
 
-            for symbol in self.symbols:
-                try:
-                    await self._scan_symbol(symbol)
-                    
-                    if self.heartbeat:
-                     self.heartbeat.on_scan()
-
-                except Exception:
-                    # keep scanner alive no matter what one symbol does
-                    continue
+            batch = await self._fetch_candles_batch()
+            await asyncio.gather(
+                *(self._scan_guarded(symbol, sem, batch.get(symbol)) for symbol in self.symbols)
+            )
 
             elapsed = time.time() - loop_start
             sleep_for = max(1.0, float(tf_seconds) - elapsed)
             await asyncio.sleep(sleep_for)
 
 
-    async def _scan_symbol(self, symbol: str) -> None:
-        candles = await self._fetch_candles(symbol)
-        last_price = float(candles[-1][4])  # close
+    async def _scan_guarded(
+        self, symbol: str, sem: asyncio.Semaphore, candles: Optional[List[List[float]]] = None
+    ) -> None:
+        async with sem:
+            try:
+                await self._scan_symbol(symbol, candles)
+
+                if self.heartbeat:
+                    self.heartbeat.on_scan()
+
+            except Exception:
+                # keep scanner alive no matter what one symbol does
+                pass
+
+    async def _scan_symbol(self, symbol: str, candles: Optional[List[List[float]]] = None) -> None:
+        if candles is None:
+            candles = await self._fetch_candles(symbol)
+        if not candles:
+            return
+        last = candles[-1]
+        last_price = float(last[4])  # close
+        last_ts = int(last[0])
 
         logger.debug("_scan_symbol: %s last_price=%s candles=%d", symbol, last_price, len(candles))
 
-        self.bus.publish(
-            EventType.PRICE_TICK,
-            {
-                "symbol": symbol,
-                "price": last_price,
-            },
-        )
+        # Same bar, same price: subscribers would only redo the last tick
+        tick = (last_ts, last_price)
+        if self._last_tick.get(symbol) != tick:
+            self.bus.publish(
+                EventType.PRICE_TICK,
+                {
+                    "symbol": symbol,
+                    "price": last_price,
+                },
+            )
+            _lru_put(self._last_tick, symbol, tick, self._cache_cap)
 
-        logger.debug("PRICE_TICK published for %s @ %s", symbol, last_price)
+            logger.debug("PRICE_TICK published for %s @ %s", symbol, last_price)
 
-        if not candles or len(candles) < 60:
+        # Everything below is skipped until a new bar shows up
+        if len(candles) < 60:
             return
-
-        last_ts = int(candles[-1][0])
         if self._last_ts.get(symbol) == last_ts:
             return
-        self._last_ts[symbol] = last_ts
+        _lru_put(self._last_ts, symbol, last_ts, self._cache_cap)
 
-        indicators = self._compute_indicators(candles)
+        indicators = self._compute_indicators(candles, symbol)
 
         context: Dict[str, Any] = {
             "equity": self.equity,
@@ -251,7 +364,7 @@ class ScannerService:
             if (not self.test_force_once_per_symbol) or (symbol not in self._forced_symbols):
                 forced = self._force_test_signal(symbol, candles, indicators, context)
                 if forced:
-                    self._forced_symbols.add(symbol)
+                    _lru_put(self._forced_symbols, symbol, True, self._cache_cap)
                     self.bus.publish(EventType.SIGNAL_CREATED, (forced, candles, indicators))
                     return
 
@@ -326,6 +439,21 @@ class ScannerService:
 
         self.bus.publish(EventType.SIGNAL_CREATED, (signal, candles, indicators))
 
+    async def _fetch_candles_batch(self) -> Dict[str, List[List[float]]]:
+        """
+        One round trip for every symbol when the client offers
+        get_ohlcv_batch(symbols, timeframe, limit=...) -> {symbol: candles}.
+        Returns {} otherwise (or on failure); missing symbols are then
+        fetched one by one in _scan_symbol.
+        """
+        if not hasattr(self.client, "get_ohlcv_batch"):
+            return {}
+        try:
+            return await self.client.get_ohlcv_batch(self.symbols, self.timeframe, limit=self.candle_limit) or {}
+        except Exception:
+            logger.debug("get_ohlcv_batch failed; falling back to per-symbol fetches", exc_info=True)
+            return {}
+
     async def _fetch_candles(self, symbol: str) -> List[List[float]]:
         """
         Your DataClient.get_ohlcv is async -> MUST be awaited.
@@ -342,32 +470,108 @@ class ScannerService:
 
         raise AttributeError("Data client has no async get_ohlcv/fetch_ohlcv method")
 
-    def _compute_indicators(self, candles: List[List[float]]) -> Dict[str, Any]:
-        arr = np.array(candles, dtype=float)
-        ts = arr[:, 0].astype(np.int64)
-        o = arr[:, 1]
-        h = arr[:, 2]
-        l = arr[:, 3]
-        c = arr[:, 4]
-        v = arr[:, 5]
-
-        ema9 = _ema(c, 9)
-        ema20 = _ema(c, 20)
-        ema50 = _ema(c, 50)
-        atr14 = _atr(h, l, c, 14)
+    def _candle_columns(self, candles: List[List[float]], symbol: Optional[str] = None) -> np.ndarray:
+        """
+        Candles as a (6, n) float64 array, one contiguous row per column.
+        Rows that were already closed on the previous scan are copied over from
+        the cached buffer; only the previously forming bar and newer rows are
+        converted from Python lists.
+
+        Stays float64 on purpose: millisecond timestamps (~1.7e12) are not
+        representable in float32, and low-priced symbols would lose most of
+        their tick precision.
+        """
+        n = len(candles)
+        prev = self._candles_np.get(symbol) if symbol is not None else None
+        cols = None
+        if prev is not None and prev.shape[1] == n and n >= 2:
+            k = int(np.searchsorted(prev[0], candles[0][0]))
+            keep = n - 1 - k
+            if k < n and prev[0, k] == candles[0][0] and (keep == 0 or candles[keep - 1][0] == prev[0, n - 2]):
+                cols = np.empty((6, n), dtype=np.float64)
+                cols[:, :keep] = prev[:, k : n - 1]
+                cols[:, keep:] = np.array(candles[keep:], dtype=np.float64).T
+        if cols is None:
+            cols = np.ascontiguousarray(np.array(candles, dtype=np.float64).T)
+        if symbol is not None:
+            _lru_put(self._candles_np, symbol, cols, self._cache_cap)
+        return cols
+
+    def _compute_indicators(self, candles: List[List[float]], symbol: Optional[str] = None) -> Dict[str, Any]:
+        cols = self._candle_columns(candles, symbol)
+        ts = cols[0].astype(np.int64)
+        o = cols[1]
+        h = cols[2]
+        l = cols[3]
+        c = cols[4]
+        v = cols[5]
+
+        # Breakout level: max high over the `lookback` closed bars before the last
+        lookback = min(self.breakout_lookback, len(h) - 1)
 
-        vol_ma20 = _rolling_mean(v, 20)
-        rel_vol = float(v[-1] / vol_ma20[-1]) if not np.isnan(vol_ma20[-1]) and vol_ma20[-1] > 0 else 0.0
-        vol_spike = float(v[-1] / vol_ma20[-1]) if not np.isnan(vol_ma20[-1]) and vol_ma20[-1] > 0 else 0.0
+        # The last candle is still forming, so the state holds values through
+        # the last closed bar (ts[-2]) and the forming bar is stepped on top each
+        # scan. When the previous closed bar is now third-to-last, exactly one
+        # bar closed since and a single step brings the state up to date.
+        st = self._state.get(symbol) if symbol is not None else None
+        if st is not None and len(c) >= 3 and int(ts[-3]) == st["ts"] and lookback == st["lookback"]:
+            ema9_c = _ema_next(st["ema9"], float(c[-2]), 9)
+            ema20_c = _ema_next(st["ema20"], float(c[-2]), 20)
+            ema50_c = _ema_next(st["ema50"], float(c[-2]), 50)
+            atr_c = _atr_next(st["atr14"], float(h[-2]), float(l[-2]), float(c[-3]), 14)
+
+            vols = st["vol_deque"]
+            vol_sum = st["vol_sum"] + float(v[-2])
+            if len(vols) == vols.maxlen:
+                vol_sum -= vols[0]
+            vols.append(float(v[-2]))
+
+            highs = st["highs_deque"]
+            if highs is not None:
+                _window_max_push(highs, int(ts[-2]), float(h[-2]), int(ts[-(lookback + 1)]))
+        else:
+            ema9_c, ema20_c, ema50_c = _ema_triple_last(c[:-1], 9, 20, 50)
+            atr_c = _atr_last(h[:-1], l[:-1], c[:-1], 14)
+
+            vols = deque((float(x) for x in v[-20:-1]), maxlen=19)
+            vol_sum = float(sum(vols))
+
+            highs = None
+            if lookback >= 2:
+                highs = deque()
+                t_min = int(ts[-(lookback + 1)])
+                for i in range(len(h) - lookback - 1, len(h) - 1):
+                    _window_max_push(highs, int(ts[i]), float(h[i]), t_min)
+
+        if symbol is not None:
+            state = {
+                "ts": int(ts[-2]),
+                "ema9": ema9_c,
+                "ema20": ema20_c,
+                "ema50": ema50_c,
+                "atr14": atr_c,
+                "vol_deque": vols,
+                "vol_sum": vol_sum,
+                "lookback": lookback,
+                "highs_deque": highs,
+            }
+            _lru_put(self._state, symbol, state, self._cache_cap)
+
+        last_close = float(c[-1])
+        ema9 = _ema_next(ema9_c, last_close, 9)
+        ema20 = _ema_next(ema20_c, last_close, 20)
+        ema50 = _ema_next(ema50_c, last_close, 50)
+        atr14 = _atr_next(atr_c, float(h[-1]), float(l[-1]), float(c[-2]), 14)
+        vol_ma_last = (vol_sum + float(v[-1])) / 20.0 if len(vols) == vols.maxlen else np.nan
+
+        vol_ma_last = float(vol_ma_last)
+        rel_vol = float(v[-1]) / vol_ma_last if vol_ma_last > 0 and not math.isnan(vol_ma_last) else 0.0
+        vol_spike = rel_vol
 
         prev_close = float(c[-2]) if len(c) >= 2 else float(c[-1])
         gap_pct = ((float(c[-1]) - prev_close) / prev_close * 100.0) if prev_close != 0 else 0.0
 
-        lookback = min(self.breakout_lookback, len(h) - 1)
-        if lookback >= 2:
-            breakout_level = float(np.max(h[-(lookback + 1) : -1]))
-        else:
-            breakout_level = float(h[-1])
+        breakout_level = highs[0][1] if highs is not None else float(h[-1])
 
         return {
             "ts": ts,
@@ -376,10 +580,12 @@ class ScannerService:
             "low": l,
             "close": c,
             "volume": v,
-            "ema9": ema9,
-            "ema20": ema20,
-            "ema50": ema50,
-            "atr14": atr14,
+            # only the latest value is ever read; kept as 1-element arrays so
+            # consumers indexing [-1] keep working
+            "ema9": np.array([ema9]),
+            "ema20": np.array([ema20]),
+            "ema50": np.array([ema50]),
+            "atr14": np.array([atr14]),
             "rel_vol": rel_vol,
             "vol_spike": vol_spike,
             "gap_pct": gap_pct,
@@ -400,27 +606,23 @@ class ScannerService:
         # -------------------------
         loosen = self.loosen_factor  # default 0.30
 
-        rel_vol_min = self.min_rel_vol * (1.0 - loosen)
-        gap_min = self.min_gap_pct * (1.0 - loosen)
-
         if close < self.min_price or close > self.max_price:
             return None
 
         rel_vol = float(ind["rel_vol"])
         gap_pct = float(ind["gap_pct"])
 
-        if rel_vol < rel_vol_min:
+        if rel_vol < self._rel_vol_min:
             return None
-        if gap_pct < gap_min:
+        if gap_pct < self._gap_min:
             return None
 
-        # Candle structure filter (Warrior-style)
-        if not self._candle_structure_ok(candles):
+        # Volume spike filter
+        if float(ind.get("vol_spike", 0.0)) < self.min_vol_spike:
             return None
 
-        # Volume spike filter
-        min_vol_spike = float(getattr(self, "min_vol_spike", 1.8))
-        if float(ind.get("vol_spike", 0.0)) < min_vol_spike:
+        # Candle structure filter (Warrior-style)
+        if not self._candle_structure_ok(candles):
             return None
 
         # Order-flow gating (if configured)
@@ -428,20 +630,18 @@ class ScannerService:
         bid_ask_ratio = float(of.get("bid_ask_ratio") or 1.0)
         buy_sell_ratio = float(of.get("buy_sell_ratio") or 1.0)
 
-        min_ba = float(getattr(self, "min_bid_ask_ratio", 1.25)) * (1.0 - float(getattr(self, "loosen_factor", 0.0)))
-        min_bs = float(getattr(self, "min_buy_sell_ratio", 1.15)) * (1.0 - float(getattr(self, "loosen_factor", 0.0)))
+        if bid_ask_ratio < self._min_ba or buy_sell_ratio < self._min_bs:
+            return None
 
-        if bid_ask_ratio < min_ba or buy_sell_ratio < min_bs:
+        atr = float(ind["atr14"][-1]) if len(ind["atr14"]) else 0.0
+        if atr <= 0.0 or (atr / close) < self.min_atr_fraction:
             return None
 
+        # EMAs are only read once the cheaper gates have passed
         ema9 = float(ind["ema9"][-1])
         ema20 = float(ind["ema20"][-1])
         ema50 = float(ind["ema50"][-1])
 
-        atr = float(ind["atr14"][-1]) if len(ind["atr14"]) else 0.0
-        if atr <= 0.0 or (atr / close) < self.min_atr_fraction:
-            return None
-
         # Allow minor EMA compression (30% of ATR)
         ema_tol = loosen * atr
         if not (
@@ -458,8 +658,7 @@ class ScannerService:
             return None
 
         # Stop logic: below EMA20 and recent swing low (last 5 candles)
-        recent_lows = [float(c[3]) for c in candles[-5:]]
-        swing_low = min(recent_lows)
+        swing_low = float(min(row[3] for row in candles[-5:]))
         stop = min(ema20, swing_low)
         if stop >= close:
             return None
@@ -537,19 +736,10 @@ class ScannerService:
 
     def _candle_structure_ok(self, candles):
         # candles: [ts, open, high, low, close, volume]
-        o = float(candles[-1][1])
-        h = float(candles[-1][2])
-        l = float(candles[-1][3])
-        c = float(candles[-1][4])
+        o, h, l, c = candles[-1][1:5]
         rng = max(1e-9, h - l)
 
         body = abs(c - o)
         upper_wick = h - max(o, c)
 
-        body_pct = body / rng
-        upper_wick_pct = upper_wick / rng
-
-        min_body = float(getattr(self, "min_body_pct", 0.55))
-        max_wick = float(getattr(self, "max_upper_wick_pct", 0.35))
-
-        return (body_pct >= min_body) and (upper_wick_pct <= max_wick)
+        return (body / rng >= self.min_body_pct) and (upper_wick / rng <= self.max_upper_wick_pct)
@@ -9,18 +9,197 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import functools
+import threading
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 
+from core.events import EventType
 
-@dataclass
+
+def _ttl_cached(ttl_seconds: float):
+    """
+    Memoize a no-argument handler's text per instance until trades.db changes
+    (its signature) or ttl_seconds pass, whichever comes first.
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(self):
+            now = time.monotonic()
+            sig = self._db_sig()
+            hit = self._ttl_cache.get(name)
+            if hit is not None and hit[1] > now and hit[2] == sig:
+                return hit[0]
+            value = fn(self)
+            self._ttl_cache[name] = (value, now + ttl_seconds, sig)
+            return value
+        return wrapper
+    return decorator
+
+
+# __slots__ dataclasses need Python 3.10+; plain dataclasses on older versions
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Button:
     """Telegram inline button."""
     text: str
     callback_data: str
 
 
+# Menu button layouts; these never change at runtime
+_MENU_BUTTONS = {
+    "main_menu": (
+        (Button("📊 Analytics", "analytics_menu"),),
+        (Button("📝 Reports", "reports_menu"),),
+        (Button("💼 Portfolio", "portfolio_dashboard"),),
+        (Button("🎯 Strategies", "strategies_menu"),),
+        (Button("🏠 Home", "main_menu"),),
+    ),
+    "analytics_menu": (
+        (Button("📊 Full Report", "analytics_full"),),
+        (Button("📈 By Symbol", "analytics_symbols"),),
+        (Button("📅 Last 7 Days", "analytics_7day"),),
+        (Button("📋 Export JSON", "analytics_json"),),
+        (Button("🔙 Back", "main_menu"),),
+    ),
+    "reports_menu": (
+        (Button("📅 Weekly Report", "report_weekly"),),
+        (Button("📆 Monthly Report", "report_monthly"),),
+        (Button("📤 Export Weekly", "report_export_weekly"),),
+        (Button("📤 Export Monthly", "report_export_monthly"),),
+        (Button("🎯 Set Goals", "report_goals"),),
+        (Button("🔙 Back", "main_menu"),),
+    ),
+    "strategies_menu": (
+        (Button("⚔️ Warrior Momentum", "strategy_warrior"),),
+        (Button("📉 Mean Reversion", "strategy_mean_reversion"),),
+        (Button("📐 Grid Trading", "strategy_grid"),),
+        (Button("🔄 Adaptive Grid", "strategy_adaptive_grid"),),
+        (Button("🔙 Back", "main_menu"),),
+    ),
+}
+
+# Telegram inline_keyboard rows per menu, built once at import (treat as read-only)
+_STATIC_KEYBOARDS: Dict[str, List[List[Dict]]] = {
+    name: [[{"text": b.text, "callback_data": b.callback_data} for b in row] for row in rows]
+    for name, rows in _MENU_BUTTONS.items()
+}
+
+# Fixed message text for menu and info callbacks
+_MENU_TEXTS = {
+    "main_menu": (
+        "🤖 **TradeMindIQ Control Center**\n\n"
+        "Select a module to view:\n\n"
+        "📊 **Analytics** - Performance metrics & reports\n"
+        "📝 **Reports** - Weekly/Monthly summaries\n"
+        "💼 **Portfolio** - Open positions & P/L\n"
+        "🎯 **Strategies** - Strategy info & backtests"
+    ),
+    "analytics_menu": (
+        "📊 **Analytics Dashboard**\n\n"
+        "Choose a report:\n"
+        "• Full performance report\n"
+        "• Breakdown by symbol\n"
+        "• Last 7 days\n"
+        "• Export to JSON"
+    ),
+    "reports_menu": (
+        "📝 **Reports Menu**\n\n"
+        "Choose a report:\n"
+        "• Weekly performance summary\n"
+        "• Monthly review with goals\n"
+        "• Export reports to files\n"
+        "• Set performance goals"
+    ),
+    "strategies_menu": (
+        "🎯 **Strategies**\n\n"
+        "Available strategies:\n"
+        "• Warrior Momentum - Primary strategy\n"
+        "• Mean Reversion - RSI/Bollinger Bands\n"
+        "• Grid Trading - Fixed grid levels\n"
+        "• Adaptive Grid - Volatility-adjusted"
+    ),
+    "report_goals": (
+        "🎯 **Performance Goals**\n\n"
+        "Set your weekly targets:\n"
+        "• Win Rate: 40%+\n"
+        "• Positive P&L\n"
+        "• 50+ trades/week\n"
+        "• No losses > $100\n\n"
+        "Use `/trademindiq` to return to menu."
+    ),
+    "strategy_warrior": (
+        "⚔️ **Warrior Momentum Strategy**\n\n"
+        "Rules:\n"
+        "• Trade only during high-vol session\n"
+        "• Require gap + high RVOL\n"
+        "• EMAs stacked: price > EMA9 > EMA20 > EMA50\n"
+        "• ATR-based stop placement\n"
+        "• R-multiple target (2x risk)\n\n"
+        "Parameters:\n"
+        "• min_rel_vol: 2.0\n"
+        "• min_gap_pct: 0.5\n"
+        "• session: EU/US overlap"
+    ),
+    "strategy_mean_reversion": (
+        "📉 **Mean Reversion Strategy**\n\n"
+        "Rules:\n"
+        "• RSI oversold (<30) = LONG\n"
+        "• RSI overbought (>70) = SHORT\n"
+        "• Bollinger Band touches confirm\n"
+        "• VWAP for trend confirmation\n\n"
+        "Indicators:\n"
+        "• RSI (14)\n"
+        "• Bollinger Bands (20, 2σ)\n"
+        "• VWAP (390 periods)"
+    ),
+    "strategy_grid": (
+        "📐 **Grid Trading Strategy**\n\n"
+        "Rules:\n"
+        "• Place orders at fixed intervals\n"
+        "• Buy when price drops to grid level\n"
+        "• Sell when price rises to grid level\n"
+        "• Profit from volatility\n\n"
+        "Parameters:\n"
+        "• grid_levels: 5\n"
+        "• grid_spacing: 0.5%\n"
+        "• range_width: 5%"
+    ),
+    "strategy_adaptive_grid": (
+        "🔄 **Adaptive Grid Strategy**\n\n"
+        "Rules:\n"
+        "• Grid spacing adjusts to volatility\n"
+        "• Wider grids during high vol\n"
+        "• Tighter grids during low vol\n"
+        "• Automatic adjustment\n\n"
+        "Parameters:\n"
+        "• volatility_lookback: 20\n"
+        "• volatility_multiplier: 1.5\n"
+        "• Adaptive spacing"
+    ),
+}
+
+# Complete responses for the fixed-text callbacks, built once at import (treat as read-only)
+_STATIC_RESPONSES: Dict[str, Dict] = {
+    name: {
+        "text": text,
+        "reply_markup": {
+            "inline_keyboard": _STATIC_KEYBOARDS.get(name, _STATIC_KEYBOARDS["main_menu"])
+        },
+    }
+    for name, text in _MENU_TEXTS.items()
+}
+
+# One leaderboard line: emoji, symbol, pnl, win_rate
+_SYMBOL_ROW_FMT = "{} {:<12} ${:>8.2f}  ({:.0f}% WR)"
+
+
 class TelegramDashboard:
     """
     Telegram inline keyboard dashboard for TradeMindIQ.
@@ -30,58 +209,76 @@ class TelegramDashboard:
     def __init__(self):
         # Initialize all sub-systems
         from services.analytics import PerformanceAnalytics
-        from services.reports import ReportGenerator
+        from services.reports import ReportGenerator, _db_signature
         from services.portfolio import PortfolioTracker
         
         self.analytics = PerformanceAnalytics()
         self.reports = ReportGenerator()
         self.portfolio = PortfolioTracker()
+
+        # handler name -> (text, expires_at monotonic, trades.db signature)
+        self._ttl_cache: Dict[str, tuple] = {}
+        self._db_sig = functools.partial(_db_signature, self.reports.db_path)
+
+    def invalidate_cache(self, *_args) -> None:
+        """Drop cached handler responses (e.g. after a trade closes)."""
+        self._ttl_cache.clear()
+
+    def subscribe(self, bus) -> None:
+        """Invalidate cached responses whenever a trade closes."""
+        bus.subscribe(EventType.TRADE_CLOSED, self.invalidate_cache)
     
     # ==================== ANALYTICS BUTTONS ====================
     
     def get_analytics_buttons(self) -> List[List[Button]]:
         """Get analytics dashboard buttons."""
-        return [
-            [Button("📊 Full Report", "analytics_full")],
-            [Button("📈 By Symbol", "analytics_symbols")],
-            [Button("📅 Last 7 Days", "analytics_7day")],
-            [Button("📋 Export JSON", "analytics_json")],
-            [Button("🔙 Back", "main_menu")],
-        ]
+        return [list(row) for row in _MENU_BUTTONS["analytics_menu"]]
     
     def get_main_menu_buttons(self) -> List[List[Button]]:
         """Get main menu buttons."""
-        return [
-            [Button("📊 Analytics", "analytics_menu")],
-            [Button("📝 Reports", "reports_menu")],
-            [Button("💼 Portfolio", "portfolio_dashboard")],
-            [Button("🎯 Strategies", "strategies_menu")],
-            [Button("🏠 Home", "main_menu")],
-        ]
+        return [list(row) for row in _MENU_BUTTONS["main_menu"]]
     
     def get_reports_buttons(self) -> List[List[Button]]:
         """Get reports menu buttons."""
-        return [
-            [Button("📅 Weekly Report", "report_weekly")],
-            [Button("📆 Monthly Report", "report_monthly")],
-            [Button("📤 Export Weekly", "report_export_weekly")],
-            [Button("📤 Export Monthly", "report_export_monthly")],
-            [Button("🎯 Set Goals", "report_goals")],
-            [Button("🔙 Back", "main_menu")],
-        ]
+        return [list(row) for row in _MENU_BUTTONS["reports_menu"]]
     
     def get_strategies_buttons(self) -> List[List[Button]]:
         """Get strategies menu buttons."""
-        return [
-            [Button("⚔️ Warrior Momentum", "strategy_warrior")],
-            [Button("📉 Mean Reversion", "strategy_mean_reversion")],
-            [Button("📐 Grid Trading", "strategy_grid")],
-            [Button("🔄 Adaptive Grid", "strategy_adaptive_grid")],
-            [Button("🔙 Back", "main_menu")],
-        ]
+        return [list(row) for row in _MENU_BUTTONS["strategies_menu"]]
     
     # ==================== HANDLERS ====================
     
+    # callback_data -> handler method name
+    _HANDLER_NAMES = {
+        # Main Menu
+        "main_menu": "_main_menu",
+        "analytics_menu": "_analytics_menu",
+        "reports_menu": "_reports_menu",
+        "strategies_menu": "_strategies_menu",
+        
+        # Analytics
+        "analytics_full": "_analytics_full",
+        "analytics_symbols": "_analytics_symbols",
+        "analytics_7day": "_analytics_7day",
+        "analytics_json": "_analytics_json",
+        
+        # Reports
+        "report_weekly": "_report_weekly",
+        "report_monthly": "_report_monthly",
+        "report_export_weekly": "_report_export_weekly",
+        "report_export_monthly": "_report_export_monthly",
+        "report_goals": "_report_goals",
+        
+        # Portfolio
+        "portfolio_dashboard": "_portfolio_dashboard",
+        
+        # Strategies
+        "strategy_warrior": "_strategy_warrior",
+        "strategy_mean_reversion": "_strategy_mean_reversion",
+        "strategy_grid": "_strategy_grid",
+        "strategy_adaptive_grid": "_strategy_adaptive_grid",
+    }
+    
     def handle_callback(self, callback_data: str) -> str:
         """
         Handle button callback and return response message.
@@ -92,113 +289,54 @@ class TelegramDashboard:
         Returns:
             Response message text
         """
-        handlers = {
-            # Main Menu
-            "main_menu": self._main_menu,
-            "analytics_menu": self._analytics_menu,
-            "reports_menu": self._reports_menu,
-            "strategies_menu": self._strategies_menu,
-            
-            # Analytics
-            "analytics_full": self._analytics_full,
-            "analytics_symbols": self._analytics_symbols,
-            "analytics_7day": self._analytics_7day,
-            "analytics_json": self._analytics_json,
-            
-            # Reports
-            "report_weekly": self._report_weekly,
-            "report_monthly": self._report_monthly,
-            "report_export_weekly": self._report_export_weekly,
-            "report_export_monthly": self._report_export_monthly,
-            "report_goals": self._report_goals,
-            
-            # Portfolio
-            "portfolio_dashboard": self._portfolio_dashboard,
-            
-            # Strategies
-            "strategy_warrior": self._strategy_warrior,
-            "strategy_mean_reversion": self._strategy_mean_reversion,
-            "strategy_grid": self._strategy_grid,
-            "strategy_adaptive_grid": self._strategy_adaptive_grid,
-        }
-        
-        handler = handlers.get(callback_data)
-        if handler:
-            return handler()
+        name = self._HANDLER_NAMES.get(callback_data)
+        if name:
+            return getattr(self, name)()
         else:
             return "Unknown command. Use /trademindiq to return to menu."
     
     def _main_menu(self) -> str:
         """Main menu message."""
-        return (
-            "🤖 **TradeMindIQ Control Center**\n\n"
-            "Select a module to view:\n\n"
-            "📊 **Analytics** - Performance metrics & reports\n"
-            "📝 **Reports** - Weekly/Monthly summaries\n"
-            "💼 **Portfolio** - Open positions & P/L\n"
-            "🎯 **Strategies** - Strategy info & backtests"
-        )
+        return _MENU_TEXTS["main_menu"]
     
     def _analytics_menu(self) -> str:
         """Analytics menu message."""
-        return (
-            "📊 **Analytics Dashboard**\n\n"
-            "Choose a report:\n"
-            "• Full performance report\n"
-            "• Breakdown by symbol\n"
-            "• Last 7 days\n"
-            "• Export to JSON"
-        )
+        return _MENU_TEXTS["analytics_menu"]
     
     def _reports_menu(self) -> str:
         """Reports menu message."""
-        return (
-            "📝 **Reports Menu**\n\n"
-            "Choose a report:\n"
-            "• Weekly performance summary\n"
-            "• Monthly review with goals\n"
-            "• Export reports to files\n"
-            "• Set performance goals"
-        )
+        return _MENU_TEXTS["reports_menu"]
     
     def _strategies_menu(self) -> str:
         """Strategies menu message."""
-        return (
-            "🎯 **Strategies**\n\n"
-            "Available strategies:\n"
-            "• Warrior Momentum - Primary strategy\n"
-            "• Mean Reversion - RSI/Bollinger Bands\n"
-            "• Grid Trading - Fixed grid levels\n"
-            "• Adaptive Grid - Volatility-adjusted"
-        )
+        return _MENU_TEXTS["strategies_menu"]
     
     # Analytics Handlers
+    @_ttl_cached(300)
     def _analytics_full(self) -> str:
         """Generate full analytics report."""
         return self.analytics.generate_report()
     
+    @_ttl_cached(300)
     def _analytics_symbols(self) -> str:
         """Generate symbol breakdown."""
         leaderboard = self.analytics.get_leaderboard(limit=15)
         
-        lines = ["📈 **PERFORMANCE BY SYMBOL**", ""]
-        for symbol, pnl, win_rate in leaderboard:
-            emoji = "🟢" if pnl > 0 else "🔴"
-            lines.append(f"{emoji} {symbol:<12} ${pnl:>8.2f}  ({win_rate:.0f}% WR)")
-        
-        return "\n".join(lines)
+        row = _SYMBOL_ROW_FMT.format
+        return "📈 **PERFORMANCE BY SYMBOL**\n\n" + "\n".join(
+            row("🟢" if pnl > 0 else "🔴", symbol, pnl, win_rate)
+            for symbol, pnl, win_rate in leaderboard
+        )
     
+    @_ttl_cached(300)
     def _analytics_7day(self) -> str:
         """Generate 7-day report."""
         return self.analytics.generate_report(days=7)
     
     def _analytics_json(self) -> str:
         """Export analytics to JSON."""
-        json_data = self.analytics.export_to_json()
-        
-        # Save to file
-        with open("analytics_export.json", "w") as f:
-            f.write(json_data)
+        with open("analytics_export.json", "wb") as f:
+            self.analytics.stream_to_json(f)
         
         return (
             "✅ **Analytics exported to:**\n"
@@ -207,12 +345,14 @@ class TelegramDashboard:
         )
     
     # Reports Handlers
+    @_ttl_cached(3600)
     def _report_weekly(self) -> str:
         """Generate weekly report."""
         return self.reports.generate_text_report(
             self.reports.get_current_week_report()
         )
     
+    @_ttl_cached(3600)
     def _report_monthly(self) -> str:
         """Generate monthly report."""
         return self.reports.generate_monthly_text_report(
@@ -237,17 +377,10 @@ class TelegramDashboard:
     
     def _report_goals(self) -> str:
         """Set/View goals."""
-        return (
-            "🎯 **Performance Goals**\n\n"
-            "Set your weekly targets:\n"
-            "• Win Rate: 40%+\n"
-            "• Positive P&L\n"
-            "• 50+ trades/week\n"
-            "• No losses > $100\n\n"
-            "Use `/trademindiq` to return to menu."
-        )
+        return _MENU_TEXTS["report_goals"]
     
     # Portfolio Handler
+    @_ttl_cached(60)
     def _portfolio_dashboard(self) -> str:
         """Generate portfolio dashboard."""
         return self.portfolio.generate_compact_dashboard()
@@ -255,64 +388,19 @@ class TelegramDashboard:
     # Strategy Handlers
     def _strategy_warrior(self) -> str:
         """Warrior Momentum strategy info."""
-        return (
-            "⚔️ **Warrior Momentum Strategy**\n\n"
-            "Rules:\n"
-            "• Trade only during high-vol session\n"
-            "• Require gap + high RVOL\n"
-            "• EMAs stacked: price > EMA9 > EMA20 > EMA50\n"
-            "• ATR-based stop placement\n"
-            "• R-multiple target (2x risk)\n\n"
-            "Parameters:\n"
-            "• min_rel_vol: 2.0\n"
-            "• min_gap_pct: 0.5\n"
-            "• session: EU/US overlap"
-        )
+        return _MENU_TEXTS["strategy_warrior"]
     
     def _strategy_mean_reversion(self) -> str:
         """Mean Reversion strategy info."""
-        return (
-            "📉 **Mean Reversion Strategy**\n\n"
-            "Rules:\n"
-            "• RSI oversold (<30) = LONG\n"
-            "• RSI overbought (>70) = SHORT\n"
-            "• Bollinger Band touches confirm\n"
-            "• VWAP for trend confirmation\n\n"
-            "Indicators:\n"
-            "• RSI (14)\n"
-            "• Bollinger Bands (20, 2σ)\n"
-            "• VWAP (390 periods)"
-        )
+        return _MENU_TEXTS["strategy_mean_reversion"]
     
     def _strategy_grid(self) -> str:
         """Grid Trading strategy info."""
-        return (
-            "📐 **Grid Trading Strategy**\n\n"
-            "Rules:\n"
-            "• Place orders at fixed intervals\n"
-            "• Buy when price drops to grid level\n"
-            "• Sell when price rises to grid level\n"
-            "• Profit from volatility\n\n"
-            "Parameters:\n"
-            "• grid_levels: 5\n"
-            "• grid_spacing: 0.5%\n"
-            "• range_width: 5%"
-        )
+        return _MENU_TEXTS["strategy_grid"]
     
     def _strategy_adaptive_grid(self) -> str:
         """Adaptive Grid strategy info."""
-        return (
-            "🔄 **Adaptive Grid Strategy**\n\n"
-            "Rules:\n"
-            "• Grid spacing adjusts to volatility\n"
-            "• Wider grids during high vol\n"
-            "• Tighter grids during low vol\n"
-            "• Automatic adjustment\n\n"
-            "Parameters:\n"
-            "• volatility_lookback: 20\n"
-            "• volatility_multiplier: 1.5\n"
-            "• Adaptive spacing"
-        )
+        return _MENU_TEXTS["strategy_adaptive_grid"]
     
     # ==================== TELEGRAM BOT INTEGRATION ====================
     
@@ -323,26 +411,7 @@ class TelegramDashboard:
         Returns:
             List of button rows, each row is list of button dicts
         """
-        menu_map = {
-            "main_menu": self.get_main_menu_buttons,
-            "analytics_menu": self.get_analytics_buttons,
-            "reports_menu": self.get_reports_buttons,
-            "strategies_menu": self.get_strategies_buttons,
-        }
-        
-        get_buttons = menu_map.get(callback_data, self.get_main_menu_buttons)
-        
-        keyboard = []
-        for row in get_buttons():
-            button_row = []
-            for button in row:
-                button_row.append({
-                    "text": button.text,
-                    "callback_data": button.callback_data
-                })
-            keyboard.append(button_row)
-        
-        return keyboard
+        return _STATIC_KEYBOARDS.get(callback_data, _STATIC_KEYBOARDS["main_menu"])
     
     def generate_menu_message(self, menu: str = "main_menu") -> Dict:
         """
@@ -351,6 +420,10 @@ class TelegramDashboard:
         Returns:
             Dict with 'text' and 'keyboard' for Telegram API
         """
+        static = _STATIC_RESPONSES.get(menu)
+        if static is not None:
+            return static
+        
         response_text = self.handle_callback(menu)
         keyboard = self.get_keyboard(menu)
         
@@ -362,6 +435,34 @@ class TelegramDashboard:
         }
 
 
+# Process-wide dashboard; analytics/reports/portfolio are built once, not per callback
+_DASHBOARD: Optional[TelegramDashboard] = None
+_DASHBOARD_LOCK = threading.Lock()
+
+
+def get_shared_dashboard() -> TelegramDashboard:
+    """Lazily created module-wide TelegramDashboard."""
+    global _DASHBOARD
+    if _DASHBOARD is None:
+        with _DASHBOARD_LOCK:
+            if _DASHBOARD is None:
+                _DASHBOARD = TelegramDashboard()
+    return _DASHBOARD
+
+
+def _invalidate_shared_dashboard(_payload=None) -> None:
+    if _DASHBOARD is not None:
+        _DASHBOARD.invalidate_cache()
+
+
+def subscribe_shared_dashboard(bus) -> None:
+    """
+    Invalidate the shared dashboard's cached responses whenever a trade
+    closes, without building the dashboard before it is first used.
+    """
+    bus.subscribe(EventType.TRADE_CLOSED, _invalidate_shared_dashboard)
+
+
 # ==================== STANDALONE TELEGRAM BOT ====================
 
 class TradeMindIQBot:
@@ -370,8 +471,16 @@ class TradeMindIQBot:
     For production, integrate with your existing Telegram bot.
     """
     
+    # command text -> callback_data
+    _TEXT_TO_MENU = {
+        "/trademindiq": "main_menu",
+        "/portfolio": "portfolio_dashboard",
+        "/analytics": "analytics_full",
+        "/reports": "report_weekly",
+    }
+    
     def __init__(self):
-        self.dashboard = TelegramDashboard()
+        self.dashboard = get_shared_dashboard()
     
     def handle_update(self, update: Dict) -> Optional[Dict]:
         """
@@ -388,17 +497,9 @@ class TradeMindIQBot:
             message = update["message"]
             text = message.get("text", "")
             
-            if text == "/trademindiq":
-                return self.dashboard.generate_menu_message("main_menu")
-            
-            elif text == "/portfolio":
-                return self.dashboard.generate_menu_message("portfolio_dashboard")
-            
-            elif text == "/analytics":
-                return self.dashboard.generate_menu_message("analytics_full")
-            
-            elif text == "/reports":
-                return self.dashboard.generate_menu_message("report_weekly")
+            menu = self._TEXT_TO_MENU.get(text)
+            if menu:
+                return self.dashboard.generate_menu_message(menu)
         
         # Check for callback queries
         elif "callback_query" in update:
@@ -414,14 +515,13 @@ class TradeMindIQBot:
 
 def create_dashboard_menu() -> Dict:
     """Create main dashboard menu."""
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message("main_menu")
 
 
 def quick_stats() -> str:
     """Get quick stats summary."""
-    analytics = PerformanceAnalytics()
-    summary = analytics.calculate_performance_summary()
+    summary = get_shared_dashboard().analytics.calculate_performance_summary()
     
     return (
         f"📊 **Quick Stats**\n\n"
@@ -8,11 +8,33 @@ Handles /trademindiq commands and callback queries.
 import json
 import sys
 import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Add TradeMindIQBot to path
-sys.path.insert(0, '/Users/kahangabar/Downloads/TradeMindIQBot')
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+from services.telegram_dashboard import get_shared_dashboard
+
+# Map commands to callback data
+_COMMAND_MAP = {
+    '/trademindiq': 'main_menu',
+    '/portfolio': 'portfolio_dashboard',
+    '/analytics': 'analytics_full',
+    '/reports': 'report_weekly',
+    '/weekly': 'report_weekly',
+    '/monthly': 'report_monthly',
+    '/strategy': 'strategies_menu',
+}
+
+
+def _dumps(data) -> str:
+    """indent=2 JSON text for stdout; orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
 
-from services.telegram_dashboard import TelegramDashboard
 
 def handle_command(command: str) -> dict:
     """
@@ -24,22 +46,9 @@ def handle_command(command: str) -> dict:
     Returns:
         Dict with 'text' and optional 'reply_markup' for Telegram
     """
-    dashboard = TelegramDashboard()
+    callback_data = _COMMAND_MAP.get(command, command.lstrip('/'))
     
-    # Map commands to callback data
-    command_map = {
-        '/trademindiq': 'main_menu',
-        '/portfolio': 'portfolio_dashboard', 
-        '/analytics': 'analytics_full',
-        '/reports': 'report_weekly',
-        '/weekly': 'report_weekly',
-        '/monthly': 'report_monthly',
-        '/strategy': 'strategies_menu',
-    }
-    
-    callback_data = command_map.get(command, command.lstrip('/'))
-    
-    return dashboard.generate_menu_message(callback_data)
+    return get_shared_dashboard().generate_menu_message(callback_data)
 
 
 def handle_callback(callback_data: str) -> dict:
@@ -52,22 +61,19 @@ def handle_callback(callback_data: str) -> dict:
     Returns:
         Dict with 'text' and 'reply_markup' for Telegram
     """
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message(callback_data)
 
 
 def get_dashboard() -> dict:
     """Get the main dashboard menu."""
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message('main_menu')
 
 
 def get_quick_stats() -> str:
     """Get quick stats for compact display."""
-    from services.analytics import PerformanceAnalytics
-    
-    analytics = PerformanceAnalytics()
-    summary = analytics.calculate_performance_summary()
+    summary = get_shared_dashboard().analytics.calculate_performance_summary()
     
     emoji = "🟢" if summary.total_pnl >= 0 else "🔴"
     
@@ -90,8 +96,8 @@ if __name__ == "__main__":
         else:
             response = handle_callback(command)
         
-        print(json.dumps(response, indent=2))
+        print(_dumps(response))
     else:
         # Show main menu
         response = get_dashboard()
-        print(json.dumps(response, indent=2))
+        print(_dumps(response))
@@ -4,14 +4,11 @@ TradeMindIQ Telegram Hook for Clawdbot
 Handles /trademindiq commands and inline button callbacks.
 """
 
-import json
 import sys
 import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Add TradeMindIQBot to path
-sys.path.insert(0, '/Users/kahangabar/Downloads/TradeMindIQBot')
-
-from services.telegram_dashboard import TelegramDashboard
+from services.telegram_dashboard import get_shared_dashboard
 
 
 def trademindiq_hook(update: dict) -> dict:
@@ -21,7 +18,7 @@ def trademindiq_hook(update: dict) -> dict:
     Returns:
         Dict with 'text' and 'reply_markup' for Telegram API
     """
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message('main_menu')
 
 
@@ -32,7 +29,7 @@ def portfolio_hook(update: dict) -> dict:
     Returns:
         Compact portfolio dashboard
     """
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message('portfolio_dashboard')
 
 
@@ -43,7 +40,7 @@ def analytics_hook(update: dict) -> dict:
     Returns:
         Full analytics report
     """
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message('analytics_full')
 
 
@@ -54,7 +51,7 @@ def reports_hook(update: dict) -> dict:
     Returns:
         Weekly report
     """
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message('report_weekly')
 
 
@@ -76,7 +73,7 @@ def trademindiq_callback(update: dict) -> dict:
     else:
         action = callback_data
     
-    dashboard = TelegramDashboard()
+    dashboard = get_shared_dashboard()
     return dashboard.generate_menu_message(action)
 
 
@@ -87,10 +84,7 @@ def quick_stats(update: dict) -> str:
     Returns:
         Plain text response (no keyboard)
     """
-    from services.analytics import PerformanceAnalytics
-    
-    analytics = PerformanceAnalytics()
-    summary = analytics.calculate_performance_summary()
+    summary = get_shared_dashboard().analytics.calculate_performance_summary()
     
     emoji = "🟢" if summary.total_pnl >= 0 else "🔴"
     
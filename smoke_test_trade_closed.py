@@ -19,9 +19,9 @@ trade = DummyTrade()
 
 # Load your cfg the same way your bot does (adjust if needed)
 import os
-import yaml
+from services.config import load_settings
 
-cfg = yaml.safe_load(open("settings.yaml", "r")) or {}
+cfg = load_settings()
 
 # Prefer env to avoid placeholder values in settings.yaml
 bot_token = os.getenv("TELEGRAM_BOT_TOKEN") or (cfg.get("telegram") or {}).get("bot_token")
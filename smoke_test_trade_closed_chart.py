@@ -1,33 +1,28 @@
-import time, math
+import time
 from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
 from interfaces.telegram_bot import TelegramBot
 
 # ---- build fake candle data ----
 now = int(time.time())
-candles = []
-closes = []
-price = 100.0
+i = np.arange(60)
+ts = (now - (59 - i) * 60) * 1000
+price = 100.0 + np.cumsum(np.sin(i / 6) * 0.2)
+v = 1000 + i
 
-for i in range(60):
-    ts = (now - (59 - i) * 60) * 1000
-    price += math.sin(i / 6) * 0.2
-    o = price - 0.05
-    h = price + 0.10
-    l = price - 0.10
-    c = price
-    v = 1000 + i
-    candles.append([ts, o, h, l, c, v])
-    closes.append(c)
+candles = [
+    list(row)
+    for row in zip(ts.tolist(), (price - 0.05).tolist(), (price + 0.10).tolist(),
+                   (price - 0.10).tolist(), price.tolist(), v.tolist())
+]
+closes = price.tolist()
 
-# ---- simple EMA helper ----
+# ---- simple EMA helper (seeded with the first close) ----
 def ema(arr, n):
-    k = 2 / (n + 1)
-    out = []
-    e = arr[0]
-    for x in arr:
-        e = x * k + e * (1 - k)
-        out.append(e)
-    return out
+    return pd.Series(arr).ewm(span=n, adjust=False).mean().tolist()
 
 ema9  = ema(closes, 9)
 ema20 = ema(closes, 20)
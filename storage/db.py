@@ -1,16 +1,41 @@
 import sqlite3
+import threading
+from typing import Iterable
+
 from core.models import Trade
 
 
 class TradeRepository:
+    _INSERT_SQL = """
+        INSERT INTO trades(symbol, side, entry, stop, target, filled_price,
+                           exit_price, pnl, created_at, closed_at, exit_reason)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, path: str = "trades.db", db_path: str = None):
         # Support both path and db_path for backward compatibility
         db_file = path if db_path is None else db_path
-        self.conn = sqlite3.connect(db_file)
+        # Shared with the Telegram polling thread (recent trades / stats), so
+        # allow cross-thread use and serialize access with a lock
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._lock = threading.Lock()
         self._init()
+        # one long-lived cursor for inserts; sqlite3's statement cache keeps
+        # _INSERT_SQL prepared across calls
+        self._cur = self.conn.cursor()
 
     def _init(self):
         cur = self.conn.cursor()
+        try:
+            # WAL: appends don't block report readers; NORMAL fsyncs only at checkpoints
+            cur.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-64000;"
+            )
+        except sqlite3.Error:
+            pass  # e.g. read-only file; defaults still work
         cur.execute("""
         CREATE TABLE IF NOT EXISTS trades (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -27,16 +52,17 @@ class TradeRepository:
             exit_reason TEXT
         )
         """)
+        # Report queries filter on closed_at and group by symbol
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_closed_at ON trades(closed_at)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)")
+        # Portfolio's open-position scan (closed_at IS NULL)
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_trades_open ON trades(closed_at) WHERE closed_at IS NULL")
         self.conn.commit()
 
-    def save_trade(self, trade: Trade):
-        cur = self.conn.cursor()
+    @staticmethod
+    def _trade_row(trade: Trade) -> tuple:
         s = trade.signal
-        cur.execute("""
-        INSERT INTO trades(symbol, side, entry, stop, target, filled_price,
-                           exit_price, pnl, created_at, closed_at, exit_reason)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             s.symbol,
             s.side.value,
             s.entry,
@@ -48,15 +74,30 @@ class TradeRepository:
             s.created_at.isoformat(),
             trade.closed_at.isoformat(),
             trade.exit_reason,
-        ))
-        self.conn.commit()
+        )
+
+    def save_trade(self, trade: Trade):
+        row = self._trade_row(trade)
+        with self._lock:
+            self._cur.execute(self._INSERT_SQL, row)
+            self.conn.commit()
+
+    def save_trades(self, trades: Iterable[Trade]):
+        """Insert many trades in one transaction (one commit/fsync for the batch)."""
+        rows = [self._trade_row(t) for t in trades]
+        if not rows:
+            return
+        with self._lock:
+            self._cur.executemany(self._INSERT_SQL, rows)
+            self.conn.commit()
     
     def get_recent_trades(self, limit: int = 5):
         """Get recent closed trades."""
         try:
-            cur = self.conn.cursor()
-            cur.execute("SELECT * FROM trades WHERE closed_at IS NOT NULL ORDER BY closed_at DESC LIMIT ?", (limit,))
-            rows = cur.fetchall()
+            with self._lock:
+                cur = self.conn.cursor()
+                cur.execute("SELECT * FROM trades WHERE closed_at IS NOT NULL ORDER BY closed_at DESC LIMIT ?", (limit,))
+                rows = cur.fetchall()
             if not rows:
                 return []
             columns = [desc[0] for desc in cur.description]
@@ -67,9 +108,10 @@ class TradeRepository:
     def get_summary_stats(self) -> dict:
         """Get summary statistics."""
         try:
-            cur = self.conn.cursor()
-            cur.execute("SELECT COUNT(*) as count, SUM(pnl) as total_pnl FROM trades WHERE closed_at IS NOT NULL")
-            row = cur.fetchone()
+            with self._lock:
+                cur = self.conn.cursor()
+                cur.execute("SELECT COUNT(*) as count, SUM(pnl) as total_pnl FROM trades WHERE closed_at IS NOT NULL")
+                row = cur.fetchone()
             return {
                 "total_trades": row[0] or 0,
                 "total_pnl": row[1] or 0.0
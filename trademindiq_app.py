@@ -19,6 +19,7 @@ from datetime import datetime, timedelta
 import json
 import os
 import sys
+from dataclasses import asdict
 
 # Add TradeMindIQBot to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -382,7 +383,7 @@ elif page == "Reports":
             # Daily breakdown
             st.subheader("📅 Daily Breakdown")
             if report.daily_breakdown:
-                df = pd.DataFrame(report.daily_breakdown)
+                df = pd.DataFrame(asdict(report.daily_breakdown))
                 st.dataframe(df, use_container_width=True)
             
             # Goals